@@ -7,14 +7,17 @@ Provides endpoints for prompt refinement, model selection, and plugin management
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from functools import lru_cache
 import logging
-from datetime import datetime
+import orjson
+import time
+from datetime import datetime, timezone
 
-from ..core.pipeline import PipelineOrchestrator
+from ..core.pipeline import PipelineOrchestrator, PipelineResult
 from ..core.classifier import TaskClassifier, TaskType
 from ..core.format_selector import FormatSelector, OutputFormat
 from ..core.refiner import ToneType
@@ -39,6 +42,10 @@ class ToneEnum(str, Enum):
     NEUTRAL = "neutral"
 
 
+# Request tone -> refiner tone, resolved once instead of per request
+_TONE_MAP = {tone: ToneType(tone.value) for tone in ToneEnum}
+
+
 class FormatEnum(str, Enum):
     """Output format options."""
     JSON = "json"
@@ -212,6 +219,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware for Next.js integration
@@ -230,6 +238,22 @@ format_selector = FormatSelector()
 plugin_registry = PluginRegistry()
 
 
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+# [monotonic time of last refresh, formatted timestamp]
+_TS_CACHE = [float("-inf"), ""]
+
+def _iso_now_cached() -> str:
+    """ISO timestamp refreshed at most once per second, for health probes."""
+    now = time.monotonic()
+    if now - _TS_CACHE[0] >= 1.0:
+        _TS_CACHE[:] = [now, _iso_now()]
+    return _TS_CACHE[1]
+
+
 # ============================================================================
 # Exception Handlers
 # ============================================================================
@@ -237,13 +261,13 @@ plugin_registry = PluginRegistry()
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=ErrorResponse(
             error="Internal server error",
             detail=str(exc),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_iso_now()
         ).dict()
     )
 
@@ -257,7 +281,7 @@ async def root():
     """Root endpoint - health check."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_iso_now_cached(),
         version="0.1.0"
     )
 
@@ -267,7 +291,7 @@ async def health_check():
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_iso_now_cached(),
         version="0.1.0"
     )
 
@@ -297,7 +321,33 @@ async def system_info():
 # Core Processing Endpoints
 # ============================================================================
 
-@app.post("/api/v1/process", response_model=ProcessPromptResponse, tags=["Processing"])
+def _to_process_response(result: PipelineResult) -> ProcessPromptResponse:
+    """
+    Build a ProcessPromptResponse from a PipelineResult.
+    
+    The fields come straight from the pipeline's own dataclasses, so the
+    model is constructed without re-running Pydantic validation.
+    """
+    return ProcessPromptResponse.model_construct(
+        success=True,
+        original_prompt=result.original_prompt,
+        refined_prompt=result.refined_prompt,
+        task_type=result.task_classification.task_type.value,
+        task_confidence=result.task_classification.confidence,
+        recommended_format=result.format_recommendation.recommended_format.value,
+        format_confidence=result.format_recommendation.confidence,
+        improvements=result.refinement_result.improvements,
+        stages_applied=result.refinement_result.stages_applied,
+        metadata=result.metadata,
+        timestamp=result.timestamp
+    )
+
+
+@app.post(
+    "/api/v1/process",
+    response_model=ProcessPromptResponse,
+    tags=["Processing"]
+)
 async def process_prompt(request: ProcessPromptRequest):
     """
     Process and refine a single prompt.
@@ -312,7 +362,7 @@ async def process_prompt(request: ProcessPromptRequest):
     """
     try:
         # Convert tone enum to ToneType
-        tone_type = ToneType(request.tone.value) if request.tone else ToneType.PROFESSIONAL
+        tone_type = _TONE_MAP.get(request.tone, ToneType.PROFESSIONAL)
         
         # Process the prompt
         result = orchestrator.process(
@@ -324,29 +374,21 @@ async def process_prompt(request: ProcessPromptRequest):
             apply_template=request.apply_template
         )
         
-        return ProcessPromptResponse(
-            success=True,
-            original_prompt=result.original_prompt,
-            refined_prompt=result.refined_prompt,
-            task_type=result.task_classification.task_type.value,
-            task_confidence=result.task_classification.confidence,
-            recommended_format=result.format_recommendation.recommended_format.value,
-            format_confidence=result.format_recommendation.confidence,
-            improvements=result.refinement_result.improvements,
-            stages_applied=result.refinement_result.stages_applied,
-            metadata=result.metadata,
-            timestamp=result.timestamp
-        )
+        return _to_process_response(result)
     
     except Exception as e:
-        logger.error(f"Error processing prompt: {e}", exc_info=True)
+        logger.exception("Error processing prompt: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing prompt: {str(e)}"
         )
 
 
-@app.post("/api/v1/batch", response_model=BatchProcessResponse, tags=["Processing"])
+@app.post(
+    "/api/v1/batch",
+    response_model=BatchProcessResponse,
+    tags=["Processing"]
+)
 async def batch_process(request: BatchProcessRequest):
     """
     Process multiple prompts in batch.
@@ -355,11 +397,11 @@ async def batch_process(request: BatchProcessRequest):
     """
     try:
         # Convert tone enum to ToneType
-        tone_type = ToneType(request.tone.value) if request.tone else ToneType.PROFESSIONAL
+        tone_type = _TONE_MAP.get(request.tone, ToneType.PROFESSIONAL)
         
-        # Process batch
-        results = orchestrator.process_batch(
-            prompts=request.prompts,
+        # Process prompts in worker threads so the event loop stays free
+        results = await orchestrator.aprocess_batch(
+            request.prompts,
             model_name=request.model_name,
             provider=request.provider,
             tone=tone_type
@@ -368,32 +410,15 @@ async def batch_process(request: BatchProcessRequest):
         # Get statistics
         stats = orchestrator.get_statistics(results)
         
-        # Convert results to response format
-        response_results = []
-        for result in results:
-            response_results.append(ProcessPromptResponse(
-                success=True,
-                original_prompt=result.original_prompt,
-                refined_prompt=result.refined_prompt,
-                task_type=result.task_classification.task_type.value,
-                task_confidence=result.task_classification.confidence,
-                recommended_format=result.format_recommendation.recommended_format.value,
-                format_confidence=result.format_recommendation.confidence,
-                improvements=result.refinement_result.improvements,
-                stages_applied=result.refinement_result.stages_applied,
-                metadata=result.metadata,
-                timestamp=result.timestamp
-            ))
-        
-        return BatchProcessResponse(
+        return BatchProcessResponse.model_construct(
             success=True,
             total_prompts=len(request.prompts),
-            results=response_results,
+            results=[_to_process_response(result) for result in results],
             statistics=stats
         )
     
     except Exception as e:
-        logger.error(f"Error in batch processing: {e}", exc_info=True)
+        logger.exception("Error in batch processing: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error in batch processing: {str(e)}"
@@ -419,7 +444,7 @@ async def classify_prompt(request: ClassifyRequest):
         )
     
     except Exception as e:
-        logger.error(f"Error classifying prompt: {e}", exc_info=True)
+        logger.exception("Error classifying prompt: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error classifying prompt: {str(e)}"
@@ -449,7 +474,7 @@ async def recommend_format(request: FormatRecommendationRequest):
         )
     
     except Exception as e:
-        logger.error(f"Error recommending format: {e}", exc_info=True)
+        logger.exception("Error recommending format: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error recommending format: {str(e)}"
@@ -460,7 +485,12 @@ async def recommend_format(request: FormatRecommendationRequest):
 # Model & Provider Endpoints
 # ============================================================================
 
-@app.get("/api/v1/models", response_model=List[ModelInfo], tags=["Models"])
+@app.get(
+    "/api/v1/models",
+    response_class=Response,
+    responses={200: {"model": List[ModelInfo], "content": {"application/json": {}}}},
+    tags=["Models"]
+)
 async def list_models(
     provider: Optional[str] = None,
     format: Optional[FormatEnum] = None
@@ -473,33 +503,25 @@ async def list_models(
     - format: Filter by preferred format
     """
     try:
-        models = format_selector.list_supported_models()
+        rows = format_selector.model_table()
         
         # Filter by provider if specified
         if provider:
-            models = [m for m in models if m.lower().startswith(provider.lower())]
+            prefix = provider.lower()
+            rows = [r for r in rows if f"{r[0]}/{r[1]}".lower().startswith(prefix)]
         
         # Filter by format if specified
         if format:
-            format_type = OutputFormat(format.value)
-            models = format_selector.get_models_by_format(format_type)
+            rows = [r for r in rows if r[2] == format.value]
         
-        # Convert to response format
-        result = []
-        for model_path in models:
-            provider_name, model_name = model_path.split("/")
-            rec = format_selector.recommend_format(model_name=model_name, provider=provider_name)
-            
-            result.append(ModelInfo(
-                provider=provider_name,
-                model=model_name,
-                preferred_format=rec.recommended_format.value
-            ))
-        
-        return result
+        data = [
+            {"provider": provider_name, "model": model_name, "preferred_format": preferred_format}
+            for provider_name, model_name, preferred_format in rows
+        ]
+        return Response(content=orjson.dumps(data), media_type="application/json")
     
     except Exception as e:
-        logger.error(f"Error listing models: {e}", exc_info=True)
+        logger.exception("Error listing models: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error listing models: {str(e)}"
@@ -510,15 +532,10 @@ async def list_models(
 async def list_providers():
     """List all supported providers."""
     try:
-        providers = set()
-        for model_path in format_selector.list_supported_models():
-            provider, _ = model_path.split("/")
-            providers.add(provider)
-        
-        return sorted(list(providers))
+        return sorted({provider_name for provider_name, _, _ in format_selector.model_table()})
     
     except Exception as e:
-        logger.error(f"Error listing providers: {e}", exc_info=True)
+        logger.exception("Error listing providers: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error listing providers: {str(e)}"
@@ -529,7 +546,32 @@ async def list_providers():
 # Plugin Endpoints (Future Use)
 # ============================================================================
 
-@app.get("/api/v1/plugins", response_model=List[PluginInfo], tags=["Plugins"])
+@lru_cache(maxsize=1)
+def _plugins_json() -> bytes:
+    """
+    Encode the plugin listing once; cleared when a plugin is enabled or disabled.
+    
+    Plain dicts are serialized directly, the PluginInfo schema is only
+    used for the OpenAPI docs.
+    """
+    return orjson.dumps([
+        {
+            "name": plugin.name,
+            "version": plugin.version,
+            "plugin_type": plugin.plugin_type.value,
+            "description": plugin.description or "",
+            "enabled": plugin.enabled,
+        }
+        for plugin in plugin_registry.list_plugins()
+    ])
+
+
+@app.get(
+    "/api/v1/plugins",
+    response_class=Response,
+    responses={200: {"model": List[PluginInfo], "content": {"application/json": {}}}},
+    tags=["Plugins"]
+)
 async def list_plugins():
     """
     List all available plugins.
@@ -537,22 +579,10 @@ async def list_plugins():
     Note: Plugin system is ready for future LLM integrations.
     """
     try:
-        plugins = plugin_registry.list_plugins()
-        
-        result = []
-        for plugin in plugins:
-            result.append(PluginInfo(
-                name=plugin.name,
-                version=plugin.version,
-                plugin_type=plugin.plugin_type.value,
-                description=plugin.description or "",
-                enabled=plugin.enabled
-            ))
-        
-        return result
+        return Response(content=_plugins_json(), media_type="application/json")
     
     except Exception as e:
-        logger.error(f"Error listing plugins: {e}", exc_info=True)
+        logger.exception("Error listing plugins: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error listing plugins: {str(e)}"
@@ -564,6 +594,7 @@ async def enable_plugin(plugin_name: str):
     """Enable a plugin."""
     try:
         success = plugin_registry.enable_plugin(plugin_name)
+        _plugins_json.cache_clear()
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -575,7 +606,7 @@ async def enable_plugin(plugin_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error enabling plugin: {e}", exc_info=True)
+        logger.exception("Error enabling plugin: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error enabling plugin: {str(e)}"
@@ -587,6 +618,7 @@ async def disable_plugin(plugin_name: str):
     """Disable a plugin."""
     try:
         success = plugin_registry.disable_plugin(plugin_name)
+        _plugins_json.cache_clear()
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -598,7 +630,7 @@ async def disable_plugin(plugin_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error disabling plugin: {e}", exc_info=True)
+        logger.exception("Error disabling plugin: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error disabling plugin: {str(e)}"
@@ -609,22 +641,31 @@ async def disable_plugin(plugin_name: str):
 # Utility Endpoints
 # ============================================================================
 
-@app.get("/api/v1/tones", response_model=List[str], tags=["Utilities"])
+# The enum listings never change at runtime, so their JSON bodies are
+# encoded once at import and served as-is
+_TONES_JSON = orjson.dumps([tone.value for tone in ToneType])
+_FORMATS_JSON = orjson.dumps([fmt.value for fmt in OutputFormat])
+_TASK_TYPES_JSON = orjson.dumps([task.value for task in TaskType])
+_STATIC_HEADERS = {"Cache-Control": "public, max-age=86400"}
+_STATIC_RESPONSES = {200: {"model": List[str], "content": {"application/json": {}}}}
+
+
+@app.get("/api/v1/tones", response_class=Response, responses=_STATIC_RESPONSES, tags=["Utilities"])
 async def list_tones():
     """List all available tone options."""
-    return [tone.value for tone in ToneType]
+    return Response(content=_TONES_JSON, media_type="application/json", headers=_STATIC_HEADERS)
 
 
-@app.get("/api/v1/formats", response_model=List[str], tags=["Utilities"])
+@app.get("/api/v1/formats", response_class=Response, responses=_STATIC_RESPONSES, tags=["Utilities"])
 async def list_formats():
     """List all available output formats."""
-    return [fmt.value for fmt in OutputFormat]
+    return Response(content=_FORMATS_JSON, media_type="application/json", headers=_STATIC_HEADERS)
 
 
-@app.get("/api/v1/task-types", response_model=List[str], tags=["Utilities"])
+@app.get("/api/v1/task-types", response_class=Response, responses=_STATIC_RESPONSES, tags=["Utilities"])
 async def list_task_types():
     """List all supported task types."""
-    return [task.value for task in TaskType]
+    return Response(content=_TASK_TYPES_JSON, media_type="application/json", headers=_STATIC_HEADERS)
 
 
 # ============================================================================
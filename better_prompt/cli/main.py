@@ -4,10 +4,11 @@ Better Prompt CLI - Main Application
 A beautiful command-line interface for prompt optimization.
 """
 
+import os
 import typer
 from typing import Optional, List
 from pathlib import Path
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -16,11 +17,12 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from rich import print as rprint
 
-from ..core.pipeline import PipelineOrchestrator
+from ..core.pipeline import BatchStatistics, PipelineOrchestrator
 from ..core.classifier import TaskClassifier
-from ..core.format_selector import FormatSelector, OutputFormat
+from ..core.format_selector import OutputFormat
 from ..core.refiner import ToneType
 from ..core.plugins import PluginRegistry
+from ..core._compat import json_dumps, json_loads
 
 app = typer.Typer(
     name="better-prompt",
@@ -30,6 +32,16 @@ app = typer.Typer(
 
 console = Console()
 
+_orchestrator: Optional[PipelineOrchestrator] = None
+
+
+def _get_orchestrator() -> PipelineOrchestrator:
+    """Return the shared orchestrator, creating it on first use."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = PipelineOrchestrator()
+    return _orchestrator
+
 
 # ============================================================================
 # MAIN COMMAND: Process a prompt
@@ -51,15 +63,17 @@ def process_prompt(
         "--provider", "-p",
         help="Model provider (e.g., OpenAI, Anthropic, Google)"
     ),
-    tone: Optional[str] = typer.Option(
-        "professional",
+    tone: ToneType = typer.Option(
+        ToneType.PROFESSIONAL,
         "--tone", "-t",
-        help="Tone: professional, casual, technical, creative, formal, friendly, neutral"
+        case_sensitive=False,
+        help="Tone for the refined prompt"
     ),
-    output_format: Optional[str] = typer.Option(
+    output_format: Optional[OutputFormat] = typer.Option(
         None,
         "--format", "-f",
-        help="Output format: json, xml, yaml, markdown, text"
+        case_sensitive=False,
+        help="Output format"
     ),
     no_template: bool = typer.Option(
         False,
@@ -100,13 +114,6 @@ def process_prompt(
             provider = _select_provider()
             model = _select_model(provider)
     
-    # Convert tone string to ToneType
-    try:
-        tone_type = ToneType(tone.lower())
-    except ValueError:
-        console.print(f"[red]Invalid tone: {tone}. Using 'professional'[/red]")
-        tone_type = ToneType.PROFESSIONAL
-    
     # Process the prompt
     with Progress(
         SpinnerColumn(),
@@ -115,12 +122,11 @@ def process_prompt(
     ) as progress:
         task = progress.add_task("Processing prompt...", total=None)
         
-        orchestrator = PipelineOrchestrator()
-        result = orchestrator.process(
+        result = _get_orchestrator().process(
             prompt=prompt,
             model_name=model,
             provider=provider,
-            tone=tone_type,
+            tone=tone,
             apply_template=not no_template
         )
         
@@ -163,6 +169,12 @@ def batch_process(
         "--output", "-o",
         help="Save results to JSON file"
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers", "-w",
+        min=1,
+        help="Number of worker threads (default: one per prompt, up to 32)"
+    ),
 ):
     """
     Process multiple prompts from a JSON file.
@@ -178,14 +190,15 @@ def batch_process(
     
     Example:
         better-prompt batch prompts.json -m gpt-4 -p OpenAI -o results.json
+        
+        better-prompt batch prompts.json --workers 4
     """
     console.print("\n[bold cyan]📦 Better Prompt - Batch Processing[/bold cyan]\n")
     
     # Load prompts
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            prompts = data.get("prompts", [])
+        data = json_loads(input_file.read_bytes())
+        prompts = data.get("prompts", [])
     except Exception as e:
         console.print(f"[red]Error loading file: {e}[/red]")
         raise typer.Exit(1)
@@ -197,42 +210,74 @@ def batch_process(
     console.print(f"[cyan]Found {len(prompts)} prompts to process[/cyan]\n")
     
     # Process prompts
-    orchestrator = PipelineOrchestrator()
+    orchestrator = _get_orchestrator()
+    
+    # Finished results wait here until every earlier prompt is done too
+    results = [None] * len(prompts)
+    statistics = BatchStatistics()
+    max_workers = workers or min(32, len(prompts))
+    
+    # Results are consumed in input order as soon as the next one is done:
+    # streamed to the output file, counted into the statistics and then
+    # released, so only results that finished ahead of an earlier prompt are
+    # held. They go to a temporary file beside the output file, which
+    # replaces it only once complete, so a failed run leaves no truncated
+    # JSON behind and keeps any earlier output
+    if output_file:
+        partial_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.partial")
+        out = partial_file.open("wb")
+    else:
+        out = None
+    written = 0
     
-    with Progress(console=console) as progress:
-        task = progress.add_task("[cyan]Processing prompts...", total=len(prompts))
+    try:
+        if out:
+            out.write(b'{\n  "results": [')
         
-        results = orchestrator.process_batch(
-            prompts=prompts,
-            model_name=model,
-            provider=provider
-        )
+        with Progress(console=console) as progress, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            task = progress.add_task("[cyan]Processing prompts...", total=len(prompts))
+            
+            classifications = orchestrator.task_classifier.classify_batch(prompts)
+            futures = {
+                executor.submit(
+                    orchestrator.process,
+                    prompt=p,
+                    model_name=model,
+                    provider=provider,
+                    task_classification=c
+                ): i
+                for i, (p, c) in enumerate(zip(prompts, classifications))
+            }
+            
+            # Advance as each prompt finishes; results keep input order.
+            # Popping the future drops its reference to the result
+            for future in as_completed(futures):
+                results[futures.pop(future)] = future.result()
+                progress.update(task, advance=1)
+                
+                while written < len(results) and results[written] is not None:
+                    result, results[written] = results[written], None
+                    if out:
+                        out.write(b",\n    " if written else b"\n    ")
+                        out.write(json_dumps(_batch_record(result)))
+                    statistics.add(result)
+                    written += 1
         
-        progress.update(task, advance=len(prompts))
-    
-    # Display statistics
-    stats = orchestrator.get_statistics(results)
-    _display_batch_stats(stats)
+        # Display statistics
+        stats = statistics.summary()
+        _display_batch_stats(stats)
+        
+        if out:
+            out.write(b'\n  ],\n  "statistics": ' + json_dumps(stats) + b"\n}\n")
+            out.close()
+            os.replace(partial_file, output_file)
+    except BaseException:
+        if out:
+            out.close()
+            partial_file.unlink(missing_ok=True)
+        raise
     
-    # Save results if requested
     if output_file:
-        output_data = {
-            "statistics": stats,
-            "results": [
-                {
-                    "original": r.original_prompt,
-                    "refined": r.refined_prompt,
-                    "task_type": r.task_classification.task_type.value,
-                    "confidence": r.task_classification.confidence,
-                    "format": r.format_recommendation.recommended_format.value,
-                }
-                for r in results
-            ]
-        }
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
-        
         console.print(f"\n[green]✓ Results saved to {output_file}[/green]")
     
     console.print()
@@ -281,9 +326,10 @@ def list_models(
         "--provider", "-p",
         help="Filter by provider"
     ),
-    format_type: Optional[str] = typer.Option(
+    format_type: Optional[OutputFormat] = typer.Option(
         None,
         "--format", "-f",
+        case_sensitive=False,
         help="Filter by preferred format"
     ),
 ):
@@ -299,21 +345,16 @@ def list_models(
     """
     console.print("\n[bold cyan]📋 Better Prompt - Supported Models[/bold cyan]\n")
     
-    selector = FormatSelector()
-    models = selector.list_supported_models()
+    rows = _get_orchestrator().format_selector.model_table()
     
     # Filter by provider if specified
     if provider:
-        models = [m for m in models if m.lower().startswith(provider.lower())]
+        prefix = provider.lower()
+        rows = [r for r in rows if f"{r[0]}/{r[1]}".lower().startswith(prefix)]
     
     # Filter by format if specified
     if format_type:
-        try:
-            fmt = OutputFormat(format_type.lower())
-            models = selector.get_models_by_format(fmt)
-        except ValueError:
-            console.print(f"[red]Invalid format: {format_type}[/red]")
-            raise typer.Exit(1)
+        rows = [r for r in rows if r[2] == format_type.value]
     
     # Display in table
     table = Table(show_header=True, header_style="bold magenta")
@@ -321,13 +362,11 @@ def list_models(
     table.add_column("Model", style="green")
     table.add_column("Preferred Format", style="yellow")
     
-    for model_path in models:
-        provider_name, model_name = model_path.split("/")
-        result = selector.recommend_format(model_name=model_name, provider=provider_name)
-        table.add_row(provider_name, model_name, result.recommended_format.value)
+    for provider_name, model_name, preferred_format in rows:
+        table.add_row(provider_name, model_name, preferred_format)
     
     console.print(table)
-    console.print(f"\n[cyan]Total: {len(models)} models[/cyan]\n")
+    console.print(f"\n[cyan]Total: {len(rows)} models[/cyan]\n")
 
 
 # ============================================================================
@@ -464,6 +503,17 @@ def _display_results(result, verbose: bool = False):
         console.print(f"  Timestamp: {result.timestamp}")
 
 
+def _batch_record(result) -> dict:
+    """Summarize a pipeline result for the batch output file."""
+    return {
+        "original": result.original_prompt,
+        "refined": result.refined_prompt,
+        "task_type": result.task_classification.task_type.value,
+        "confidence": result.task_classification.confidence,
+        "format": result.format_recommendation.recommended_format.value,
+    }
+
+
 def _display_batch_stats(stats: dict):
     """Display batch processing statistics."""
     console.print("\n[bold cyan]📊 Processing Statistics[/bold cyan]\n")
@@ -0,0 +1,49 @@
+"""
+Compatibility helpers for optional accelerators and newer Pythons.
+
+The core package only depends on the standard library; when orjson is
+installed it is used for JSON encoding and decoding, otherwise the
+stdlib json module is used with equivalent output.
+"""
+
+import json
+import sys
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Keyword arguments for @dataclass: slotted instances (no per-instance
+# __dict__) on Python 3.10+, where dataclass(slots=True) is available
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,10 +5,22 @@ This module provides hybrid task classification using heuristics and optional LL
 It identifies the purpose and intent of a user's prompt.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Dict, List
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Optional, Dict, List, Tuple
 import re
+import threading
+
+from .._compat import DATACLASS_SLOTS
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 class TaskType(Enum):
@@ -30,9 +42,13 @@ class TaskType(Enum):
     CREATIVE_WRITING = "creative_writing"
     TECHNICAL_WRITING = "technical_writing"
     GENERAL = "general"
+    
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent and runs in C, unlike Enum.__hash__ (hash of the name)
+    __hash__ = object.__hash__
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TaskClassificationResult:
     """
     Result of task classification.
@@ -47,14 +63,120 @@ class TaskClassificationResult:
     task_type: TaskType
     confidence: float
     reasoning: str
-    metadata: Dict[str, any] = None
+    metadata: Dict[str, any] = field(default_factory=dict)
     
-    def __post_init__(self) -> None:
-        """Validate confidence score."""
-        if not 0.0 <= self.confidence <= 1.0:
-            raise ValueError("Confidence must be between 0.0 and 1.0")
-        if self.metadata is None:
-            self.metadata = {}
+    # Validation is skipped entirely under python -O
+    if __debug__:
+        def __post_init__(self) -> None:
+            """Validate confidence score."""
+            if not 0.0 <= self.confidence <= 1.0:
+                raise ValueError("Confidence must be between 0.0 and 1.0")
+
+
+def _copy_result(result: TaskClassificationResult) -> TaskClassificationResult:
+    """Copy a result, including its metadata containers, so it can be mutated freely."""
+    return replace(result, metadata={
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in result.metadata.items()
+    })
+
+
+def _merge_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Combine word-boundary patterns into one alternation with a shared \\b.
+    
+    Factoring out the common leading \\b lets the regex engine skip
+    non-boundary positions once instead of trying every branch there; a
+    plain alternation is slower than separate searches with CPython's re.
+    The first pattern that matched is reported as group p<index>.
+    
+    Args:
+        patterns: Regex pattern strings for one task type
+        
+    Returns:
+        Compiled alternation, or None if not every pattern starts with \\b
+    """
+    if not all(pattern.startswith(r"\b") for pattern in patterns):
+        return None
+    return re.compile(r"\b(?:" + "|".join(
+        f"(?P<p{i}>{pattern[2:]})" for i, pattern in enumerate(patterns)
+    ) + ")")
+
+
+# \bword\b patterns with nothing but literal word characters, spaces and
+# hyphens between the boundaries (e.g. r"\bbroken\b")
+_LITERAL_PATTERN_RE = re.compile(r"\\b(\w[\w \-]*\w|\w)\\b")
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for regex \\b."""
+    return char.isalnum() or char == "_"
+
+
+class _LiteralPattern:
+    """
+    Stand-in for a compiled \\bliteral\\b regex, searched with str.find.
+    
+    Only search() and the pattern attribute are provided, which is all the
+    heuristic scoring uses.
+    """
+    
+    __slots__ = ("pattern", "literal")
+    
+    def __init__(self, pattern: str, literal: str):
+        self.pattern = pattern
+        self.literal = literal
+    
+    def search(self, text: str) -> bool:
+        """Whether the literal occurs in text between word boundaries."""
+        literal = self.literal
+        find = text.find
+        index = find(literal)
+        while index != -1:
+            end = index + len(literal)
+            if ((index == 0 or not _is_word_char(text[index - 1])) and
+                    (end == len(text) or not _is_word_char(text[end]))):
+                return True
+            index = find(literal, index + 1)
+        return False
+
+
+def _compile_pattern(pattern: str):
+    """Compile a task pattern, using _LiteralPattern for plain \\bword\\b patterns."""
+    match = _LITERAL_PATTERN_RE.fullmatch(pattern)
+    if match:
+        return _LiteralPattern(pattern, match.group(1))
+    return re.compile(pattern)
+
+
+def _index_keywords(keywords: Tuple[str, ...]) -> Dict[str, Tuple[int, ...]]:
+    """Map each keyword to every position it occupies in keywords."""
+    index: Dict[str, Tuple[int, ...]] = {}
+    for i, keyword in enumerate(keywords):
+        index[keyword] = index.get(keyword, ()) + (i,)
+    return index
+
+
+def _build_keyword_automaton(task_patterns: Dict) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over every lowercased task keyword.
+    
+    Args:
+        task_patterns: TaskClassifier.TASK_PATTERNS
+        
+    Returns:
+        Automaton whose matches yield the keyword, or None if pyahocorasick
+        is not installed
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for config in task_patterns.values():
+        for keyword in config["keywords"]:
+            keyword_lower = keyword.lower()
+            automaton.add_word(keyword_lower, keyword_lower)
+    automaton.make_automaton()
+    return automaton
 
 
 class TaskClassifier:
@@ -247,6 +369,65 @@ class TaskClassifier:
         },
     }
     
+    # Keywords of every task type as parallel flat tuples, in TASK_PATTERNS
+    # order, so each task's keywords occupy a contiguous index range ending
+    # at its entry in _KEYWORD_ENDS. Lowered once here instead of on every
+    # classify() call; labels are the strings reported in metadata matches
+    _FLAT_KEYWORDS: Tuple[str, ...] = tuple(
+        keyword.lower() for config in TASK_PATTERNS.values() for keyword in config["keywords"]
+    )
+    _KEYWORD_LABELS: Tuple[str, ...] = tuple(
+        f"keyword: {keyword}" for config in TASK_PATTERNS.values() for keyword in config["keywords"]
+    )
+    _KEYWORD_ENDS: Tuple[int, ...] = tuple(
+        accumulate(len(config["keywords"]) for config in TASK_PATTERNS.values())
+    )
+    
+    # Lowercased keyword -> its indices in _FLAT_KEYWORDS (a keyword may be
+    # listed under several task types)
+    _KEYWORD_INDEXES: Dict[str, Tuple[int, ...]] = _index_keywords(_FLAT_KEYWORDS)
+    
+    # TASK_PATTERNS regexes compiled once when the class is defined (see
+    # _compile_pattern). Prompts are lowercased before matching, so no
+    # IGNORECASE flag is needed
+    _COMPILED_PATTERNS: Dict[TaskType, tuple] = {
+        task_type: tuple(_compile_pattern(pattern) for pattern in config["patterns"])
+        for task_type, config in TASK_PATTERNS.items()
+    }
+    
+    # One alternation per task type, used as a pre-filter: a single search
+    # rules out the common no-match case (see _merge_patterns)
+    _MERGED_PATTERNS: Dict[TaskType, Optional[re.Pattern]] = {
+        task_type: _merge_patterns(config["patterns"])
+        for task_type, config in TASK_PATTERNS.items()
+    }
+    
+    # Everything the scoring loop needs per task type, flattened into one
+    # row so each task costs a tuple unpack instead of several dict lookups:
+    # (task_type, task_type.value, end of its keyword range, keyword
+    # increment, merged pattern, patterns, pattern increment). Increments
+    # are the task weight pre-multiplied
+    _SCORING_TABLE: Tuple[tuple, ...] = tuple(
+        (task_type, task_type.value, keywords_end, 0.2 * config["weight"],
+         merged, compiled, 0.5 * config["weight"])
+        for (task_type, config), keywords_end, merged, compiled in zip(
+            TASK_PATTERNS.items(),
+            _KEYWORD_ENDS,
+            _MERGED_PATTERNS.values(),
+            _COMPILED_PATTERNS.values(),
+        )
+    )
+    
+    # Multi-keyword matcher (None without pyahocorasick)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(TASK_PATTERNS)
+    
+    # LRU of heuristic results keyed by prompt. Heuristic classification
+    # depends on nothing but the prompt, so the cache is shared by all
+    # instances; callers always get a copy (see _copy_result)
+    _HEURISTIC_CACHE_SIZE = 512
+    _heuristic_cache: "OrderedDict[str, TaskClassificationResult]" = OrderedDict()
+    _heuristic_cache_lock = threading.Lock()
+    
     def __init__(self, llm_provider: Optional[any] = None, confidence_threshold: float = 0.7):
         """
         Initialize the TaskClassifier.
@@ -269,8 +450,47 @@ class TaskClassifier:
         Returns:
             TaskClassificationResult with task type, confidence, and reasoning
         """
+        return self._classify_one(prompt, use_llm_fallback)
+    
+    def classify_batch(
+        self,
+        prompts: List[str],
+        use_llm_fallback: bool = False
+    ) -> List[TaskClassificationResult]:
+        """
+        Classify multiple prompts.
+        
+        With pyahocorasick installed, keywords for the whole batch are found
+        in a single automaton pass over the joined prompts.
+        
+        Args:
+            prompts: List of user prompts
+            use_llm_fallback: Whether to use LLM fallback if confidence is low
+            
+        Returns:
+            List of TaskClassificationResult, in the same order as prompts
+        """
+        if self._KEYWORD_AUTOMATON is None or not prompts:
+            return [self._classify_one(prompt, use_llm_fallback) for prompt in prompts]
+        
+        # Lowercase each prompt once for both the keyword scan and scoring
+        prompts_lower = [prompt.lower() for prompt in prompts]
+        keyword_hits = self._find_keywords_batch(prompts_lower)
+        return [
+            self._classify_one(prompt, use_llm_fallback, hits, prompt_lower)
+            for prompt, prompt_lower, hits in zip(prompts, prompts_lower, keyword_hits)
+        ]
+    
+    def _classify_one(
+        self,
+        prompt: str,
+        use_llm_fallback: bool,
+        keyword_hits: Optional[List[int]] = None,
+        prompt_lower: Optional[str] = None
+    ) -> TaskClassificationResult:
+        """Heuristic classification with optional LLM fallback for one prompt."""
         # First, try heuristic classification
-        result = self._classify_heuristic(prompt)
+        result = self._classify_heuristic_cached(prompt, keyword_hits, prompt_lower)
         
         # If confidence is low and LLM fallback is enabled, use LLM
         if (use_llm_fallback and 
@@ -281,43 +501,76 @@ class TaskClassifier:
         
         return result
     
-    def _classify_heuristic(self, prompt: str) -> TaskClassificationResult:
+    def _classify_heuristic(
+        self,
+        prompt: str,
+        keyword_hits: Optional[List[int]] = None,
+        prompt_lower: Optional[str] = None
+    ) -> TaskClassificationResult:
         """
         Classify using heuristic pattern matching.
         
         Args:
             prompt: The user's input prompt
+            keyword_hits: Sorted _FLAT_KEYWORDS indices of the keywords in
+                the prompt (see _find_keywords); computed here if None
+            prompt_lower: prompt.lower(), if the caller already has it
             
         Returns:
             TaskClassificationResult
         """
-        prompt_lower = prompt.lower()
-        scores: Dict[TaskType, float] = {}
-        matches: Dict[TaskType, List[str]] = {}
+        if prompt_lower is None:
+            prompt_lower = prompt.lower()
+        # Keyed by task type value, ready for the all_scores metadata
+        scores: Dict[str, float] = {}
+        
+        # Highest-scoring task so far; ties keep the earlier task type
+        best_task: Optional[TaskType] = None
+        best_score = 0.0
+        best_matches: List[str] = []
+        
+        if keyword_hits is None:
+            keyword_hits = self._find_keywords(prompt_lower)
+        keyword_labels = self._KEYWORD_LABELS
+        hit = 0
+        hit_count = len(keyword_hits)
         
         # Calculate scores for each task type
-        for task_type, config in self.TASK_PATTERNS.items():
+        for (task_type, task_value, keywords_end, keyword_inc,
+                merged, patterns, pattern_inc) in self._SCORING_TABLE:
             score = 0.0
             task_matches = []
             
-            # Check keywords
-            for keyword in config["keywords"]:
-                if keyword.lower() in prompt_lower:
-                    score += 0.2 * config["weight"]  # Increased from 0.1
-                    task_matches.append(f"keyword: {keyword}")
+            # Check keywords (0.2 x weight each, increased from 0.1): the
+            # hits are sorted, so this task's are the ones before its end
+            while hit < hit_count and keyword_hits[hit] < keywords_end:
+                score += keyword_inc
+                task_matches.append(keyword_labels[keyword_hits[hit]])
+                hit += 1
             
-            # Check regex patterns
-            for pattern in config["patterns"]:
-                if re.search(pattern, prompt_lower, re.IGNORECASE):
-                    score += 0.5 * config["weight"]  # Increased from 0.3
-                    task_matches.append(f"pattern: {pattern}")
+            # Check regex patterns (0.5 x weight each, increased from 0.3):
+            # the merged alternation rules out the common no-match case in
+            # one scan; only when it hits are the individual patterns
+            # checked, since each one adds to the score
+            if merged is None:
+                first = -1  # No pre-filter, check every pattern
+            else:
+                merged_match = merged.search(prompt_lower)
+                first = int(merged_match.lastgroup[1:]) if merged_match else None
+            if first is not None:
+                for i, pattern in enumerate(patterns):
+                    if i == first or pattern.search(prompt_lower):
+                        score += pattern_inc
+                        task_matches.append(f"pattern: {pattern.pattern}")
             
             if score > 0:
-                scores[task_type] = min(score, 1.0)  # Cap at 1.0
-                matches[task_type] = task_matches
+                score = min(score, 1.0)  # Cap at 1.0
+                scores[task_value] = score
+                if score > best_score:
+                    best_task, best_score, best_matches = task_type, score, task_matches
         
         # If no matches, default to GENERAL
-        if not scores:
+        if best_task is None:
             return TaskClassificationResult(
                 task_type=TaskType.GENERAL,
                 confidence=0.5,
@@ -325,26 +578,101 @@ class TaskClassifier:
                 metadata={"method": "heuristic", "matches": []}
             )
         
-        # Get the task type with highest score
-        best_task = max(scores.items(), key=lambda x: x[1])
-        task_type, confidence = best_task
-        
         reasoning = (
-            f"Classified as {task_type.value} based on heuristic analysis. "
-            f"Matched: {', '.join(matches[task_type][:3])}"
+            f"Classified as {best_task.value} based on heuristic analysis. "
+            f"Matched: {', '.join(best_matches[:3])}"
         )
         
         return TaskClassificationResult(
-            task_type=task_type,
-            confidence=confidence,
+            task_type=best_task,
+            confidence=best_score,
             reasoning=reasoning,
             metadata={
                 "method": "heuristic",
-                "matches": matches[task_type],
-                "all_scores": {k.value: v for k, v in scores.items()}
+                "matches": best_matches,
+                "all_scores": scores
             }
         )
     
+    def _classify_heuristic_cached(
+        self,
+        prompt: str,
+        keyword_hits: Optional[List[int]] = None,
+        prompt_lower: Optional[str] = None
+    ) -> TaskClassificationResult:
+        """
+        Classify using heuristics, reusing results for recently seen prompts.
+        
+        Args:
+            prompt: The user's input prompt
+            keyword_hits: Passed to _classify_heuristic on a cache miss
+            prompt_lower: Passed to _classify_heuristic on a cache miss
+            
+        Returns:
+            A fresh TaskClassificationResult the caller may mutate
+        """
+        cache = self._heuristic_cache
+        with self._heuristic_cache_lock:
+            result = cache.get(prompt)
+            if result is not None:
+                cache.move_to_end(prompt)
+        
+        if result is None:
+            result = self._classify_heuristic(prompt, keyword_hits, prompt_lower)
+            with self._heuristic_cache_lock:
+                cache[prompt] = result
+                if len(cache) > self._HEURISTIC_CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        return _copy_result(result)
+    
+    def _find_keywords(self, prompt_lower: str) -> List[int]:
+        """
+        Find the keywords present in a lowercased prompt.
+        
+        With pyahocorasick, all keywords are found in one pass; otherwise
+        each keyword is checked with a substring test.
+        
+        Args:
+            prompt_lower: The lowercased prompt
+            
+        Returns:
+            Sorted indices into _FLAT_KEYWORDS of the matched keywords
+        """
+        if self._KEYWORD_AUTOMATON is None:
+            return [
+                i for i, keyword in enumerate(self._FLAT_KEYWORDS)
+                if keyword in prompt_lower
+            ]
+        return self._keyword_hits(
+            {keyword for _, keyword in self._KEYWORD_AUTOMATON.iter(prompt_lower)}
+        )
+    
+    def _keyword_hits(self, keywords: set) -> List[int]:
+        """Sorted _FLAT_KEYWORDS indices of a set of matched keywords."""
+        index = self._KEYWORD_INDEXES
+        return sorted([i for keyword in keywords for i in index[keyword]])
+    
+    def _find_keywords_batch(self, prompts_lower: List[str]) -> List[List[int]]:
+        """
+        Collect the keywords present in each of several lowercased prompts.
+        
+        The prompts are joined with NUL separators (no keyword contains one,
+        so no match spans two prompts) and scanned once; each hit is mapped
+        back to its prompt by binary search over the start offsets.
+        
+        Args:
+            prompts_lower: Lowercased prompts
+            
+        Returns:
+            Sorted _FLAT_KEYWORDS indices of the matched keywords, per prompt
+        """
+        starts = list(accumulate((len(p) + 1 for p in prompts_lower[:-1]), initial=0))
+        found = [set() for _ in prompts_lower]
+        for end, keyword in self._KEYWORD_AUTOMATON.iter("\x00".join(prompts_lower)):
+            found[bisect_right(starts, end) - 1].add(keyword)
+        return [self._keyword_hits(keywords) for keywords in found]
+    
     def _classify_with_llm(self, prompt: str) -> TaskClassificationResult:
         """
         Classify using LLM fallback (placeholder for future implementation).
@@ -6,13 +6,83 @@ It recommends the best output format (JSON, XML, YAML, Markdown, etc.) based on
 the target model and task type.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 import json
 import os
+import re
+import sys
 from pathlib import Path
 
+from .._compat import DATACLASS_SLOTS
+
+
+# {{placeholder}} slots in the template skeletons
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+class _BlankMissing(dict):
+    """format_map() mapping that renders unfilled placeholders as empty strings."""
+    
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _compile_template(template: str) -> str:
+    """
+    Convert a {{placeholder}} skeleton into a str.format_map() format string.
+    
+    Literal braces (e.g. in the JSON skeleton) are escaped so only the
+    placeholders are substituted.
+    
+    Args:
+        template: Template skeleton
+        
+    Returns:
+        Format string with {placeholder} fields
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    # split() alternates literal text and placeholder names
+    parts[::2] = [part.replace("{", "{{").replace("}", "}}") for part in parts[::2]]
+    parts[1::2] = ["{" + name + "}" for name in parts[1::2]]
+    return "".join(parts)
+
+
+# Trie nodes are plain dicts keyed by character; the empty-string key
+# marks the end of an inserted model key and holds the key itself
+_TRIE_END = ""
+
+
+def _trie_insert(trie: Dict, key: str) -> None:
+    """Insert key into a dict-of-dicts trie."""
+    node = trie
+    for char in key:
+        node = node.setdefault(char, {})
+    node[_TRIE_END] = key
+
+
+def _trie_longest_prefix(trie: Dict, chars) -> Optional[str]:
+    """
+    Find the longest inserted key that is a prefix of chars.
+    
+    Args:
+        trie: Trie built with _trie_insert
+        chars: Iterable of characters to walk
+        
+    Returns:
+        The matching key as stored in the trie, or None
+    """
+    node = trie
+    best = None
+    for char in chars:
+        node = node.get(char)
+        if node is None:
+            break
+        best = node.get(_TRIE_END, best)
+    return best
+
 
 class OutputFormat(Enum):
     """Supported output formats."""
@@ -22,9 +92,13 @@ class OutputFormat(Enum):
     YAML = "yaml"
     MARKDOWN = "markdown"
     TEXT = "text"
+    
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent and runs in C, unlike Enum.__hash__ (hash of the name)
+    __hash__ = object.__hash__
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormatRecommendation:
     """
     Result of format selection.
@@ -41,14 +115,14 @@ class FormatRecommendation:
     explanation: str
     template_skeleton: str
     confidence: float
-    metadata: Dict[str, any] = None
+    metadata: Dict[str, any] = field(default_factory=dict)
     
-    def __post_init__(self) -> None:
-        """Validate confidence score."""
-        if not 0.0 <= self.confidence <= 1.0:
-            raise ValueError("Confidence must be between 0.0 and 1.0")
-        if self.metadata is None:
-            self.metadata = {}
+    # Validation is skipped entirely under python -O
+    if __debug__:
+        def __post_init__(self) -> None:
+            """Validate confidence score."""
+            if not 0.0 <= self.confidence <= 1.0:
+                raise ValueError("Confidence must be between 0.0 and 1.0")
 
 
 class FormatSelector:
@@ -131,6 +205,19 @@ Expected Output: {{output_description}}"""
         OutputFormat.TEXT: "Plain text format is universal and works well for simple, conversational prompts without complex structure."
     }
     
+    # FORMAT_TEMPLATES pre-converted for render_template, parsed once here
+    _COMPILED_TEMPLATES: Dict[OutputFormat, str] = {
+        fmt: _compile_template(template) for fmt, template in FORMAT_TEMPLATES.items()
+    }
+    
+    # (explanation, template) per format, fetched with one lookup
+    _FORMAT_DETAILS: Dict[OutputFormat, Tuple[str, str]] = {
+        fmt: (explanation, template)
+        for (fmt, explanation), template in zip(
+            FORMAT_EXPLANATIONS.items(), map(FORMAT_TEMPLATES.get, FORMAT_EXPLANATIONS)
+        )
+    }
+    
     def __init__(self, mapping_path: Optional[str] = None):
         """
         Initialize the FormatSelector.
@@ -149,6 +236,11 @@ Expected Output: {{output_description}}"""
         # Build reverse index for faster lookup
         self.model_to_format: Dict[str, str] = {}
         self._build_model_index()
+        
+        # Per-instance memo of the lookup kernel; the mapping is fixed
+        # once loaded, so results only depend on the arguments
+        self._lookup = lru_cache(maxsize=1024)(self._lookup_uncached)
+        self._model_table: Optional[Tuple[Tuple[str, str, str], ...]] = None
     
     def _load_mapping(self) -> Dict[str, Dict[str, str]]:
         """
@@ -170,10 +262,47 @@ Expected Output: {{output_description}}"""
         """Build a flat index of model names to their preferred formats."""
         for provider, models in self.format_mapping.items():
             for model, format_str in models.items():
-                # Store both full name and short name
-                full_name = f"{provider.lower()}/{model.lower()}"
+                # Store both full name and short name, interned so the
+                # lookup's dict probes can short-circuit on identity
+                model_lower = sys.intern(model.lower())
+                full_name = sys.intern(f"{provider.lower()}/{model_lower}")
                 self.model_to_format[full_name] = format_str
-                self.model_to_format[model.lower()] = format_str
+                self.model_to_format[model_lower] = format_str
+        
+        # Forward and reverse tries over the index keys answer the common
+        # partial-match cases ("gpt-4-0613", "openai/gpt-4") in O(len(name))
+        self._prefix_trie: Dict = {}
+        self._suffix_trie: Dict = {}
+        for model_key in self.model_to_format:
+            _trie_insert(self._prefix_trie, model_key)
+            _trie_insert(self._suffix_trie, model_key[::-1])
+    
+    def _find_partial_match(self, model_lower: str) -> Optional[str]:
+        """
+        Find an index key that partially matches a lowercased model name.
+        
+        The longest key the name starts with wins, then the longest key it
+        ends with; only if both miss are all keys scanned for a substring
+        match in either direction.
+        
+        Args:
+            model_lower: Lowercased model name
+            
+        Returns:
+            Matching key from model_to_format, or None
+        """
+        model_key = _trie_longest_prefix(self._prefix_trie, model_lower)
+        if model_key is not None:
+            return model_key
+        
+        reversed_key = _trie_longest_prefix(self._suffix_trie, reversed(model_lower))
+        if reversed_key is not None:
+            return reversed_key[::-1]
+        
+        for model_key in self.model_to_format:
+            if model_lower in model_key or model_key in model_lower:
+                return model_key
+        return None
     
     def recommend_format(
         self,
@@ -194,42 +323,78 @@ Expected Output: {{output_description}}"""
         Returns:
             FormatRecommendation with format, explanation, and template
         """
+        recommended_format, confidence, explanation, template = self._lookup(
+            model_name, provider, fallback_format
+        )
+        
+        return FormatRecommendation(
+            recommended_format=recommended_format,
+            explanation=explanation,
+            template_skeleton=template,
+            confidence=confidence,
+            metadata={
+                "model_name": model_name,
+                "provider": provider,
+                "task_type": task_type,
+                "mapping_source": str(self.mapping_path)
+            }
+        )
+    
+    def _lookup_uncached(
+        self,
+        model_name: Optional[str],
+        provider: Optional[str],
+        fallback_format: OutputFormat
+    ) -> Tuple[OutputFormat, float, str, str]:
+        """
+        Resolve the format for a model/provider pair (memoized as _lookup).
+        
+        Args:
+            model_name: Name of the target model
+            provider: Provider name
+            fallback_format: Format to use if no specific recommendation found
+            
+        Returns:
+            Tuple of (format, confidence, explanation, template skeleton)
+        """
         recommended_format_str = None
         confidence = 0.5
         explanation_parts = []
         
         # Try to find format based on model and provider
         if model_name:
+            model_to_format = self.model_to_format
             model_lower = model_name.lower()
             
             # Try full provider/model lookup
             if provider:
-                full_key = f"{provider.lower()}/{model_lower}"
-                if full_key in self.model_to_format:
-                    recommended_format_str = self.model_to_format[full_key]
+                format_str = model_to_format.get(f"{provider.lower()}/{model_lower}")
+                if format_str is not None:
+                    recommended_format_str = format_str
                     confidence = 1.0
                     explanation_parts.append(
                         f"Based on format mapping, {provider} {model_name} prefers {recommended_format_str}"
                     )
             
             # Try model name only
-            if not recommended_format_str and model_lower in self.model_to_format:
-                recommended_format_str = self.model_to_format[model_lower]
-                confidence = 0.9
-                explanation_parts.append(
-                    f"Based on format mapping, {model_name} prefers {recommended_format_str}"
-                )
+            if not recommended_format_str:
+                format_str = model_to_format.get(model_lower)
+                if format_str is not None:
+                    recommended_format_str = format_str
+                    confidence = 0.9
+                    explanation_parts.append(
+                        f"Based on format mapping, {model_name} prefers {recommended_format_str}"
+                    )
             
             # Try partial matching
             if not recommended_format_str:
-                for model_key, format_str in self.model_to_format.items():
-                    if model_lower in model_key or model_key in model_lower:
-                        recommended_format_str = format_str
-                        confidence = 0.7
-                        explanation_parts.append(
-                            f"Based on partial match with {model_key}, recommending {recommended_format_str}"
-                        )
-                        break
+                model_key = self._find_partial_match(model_lower)
+                if model_key is not None:
+                    recommended_format_str = model_to_format[model_key]
+                    confidence = 0.7
+                    explanation_parts.append(
+                        f"Based on partial match with {model_key}, recommending {recommended_format_str}"
+                    )
         
         # Convert string to OutputFormat enum
         if recommended_format_str:
@@ -249,23 +414,10 @@ Expected Output: {{output_description}}"""
             )
         
         # Add format-specific explanation
-        explanation_parts.append(self.FORMAT_EXPLANATIONS[recommended_format])
+        explanation, template = self._FORMAT_DETAILS[recommended_format]
+        explanation_parts.append(explanation)
         
-        # Get template skeleton
-        template_skeleton = self.FORMAT_TEMPLATES[recommended_format]
-        
-        return FormatRecommendation(
-            recommended_format=recommended_format,
-            explanation=" ".join(explanation_parts),
-            template_skeleton=template_skeleton,
-            confidence=confidence,
-            metadata={
-                "model_name": model_name,
-                "provider": provider,
-                "task_type": task_type,
-                "mapping_source": str(self.mapping_path)
-            }
-        )
+        return recommended_format, confidence, " ".join(explanation_parts), template
     
     def get_template(self, format_type: OutputFormat) -> str:
         """
@@ -279,6 +431,22 @@ Expected Output: {{output_description}}"""
         """
         return self.FORMAT_TEMPLATES.get(format_type, self.FORMAT_TEMPLATES[OutputFormat.TEXT])
     
+    def render_template(self, format_type: OutputFormat, **values: str) -> str:
+        """
+        Fill the template skeleton for a format.
+        
+        Args:
+            format_type: The output format
+            **values: Placeholder values, e.g. task_description="..."
+            
+        Returns:
+            Rendered template; placeholders without a value are left empty
+        """
+        compiled = self._COMPILED_TEMPLATES.get(
+            format_type, self._COMPILED_TEMPLATES[OutputFormat.TEXT]
+        )
+        return compiled.format_map(_BlankMissing(values))
+    
     def list_supported_models(self) -> List[str]:
         """
         List all models in the format mapping.
@@ -292,6 +460,26 @@ Expected Output: {{output_description}}"""
                 models.append(f"{provider}/{model}")
         return sorted(models)
     
+    def model_table(self) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Get the preferred format of every model in the mapping.
+        
+        The mapping is fixed once loaded, so the table is built on first
+        use and reused afterwards.
+        
+        Returns:
+            (provider, model, preferred format value) rows, sorted like
+            list_supported_models()
+        """
+        if self._model_table is None:
+            rows = []
+            for model_path in self.list_supported_models():
+                provider_name, model_name = model_path.split("/")
+                result = self.recommend_format(model_name=model_name, provider=provider_name)
+                rows.append((provider_name, model_name, result.recommended_format.value))
+            self._model_table = tuple(rows)
+        return self._model_table
+    
     def get_models_by_format(self, format_type: OutputFormat) -> List[str]:
         """
         Get all models that prefer a specific format.
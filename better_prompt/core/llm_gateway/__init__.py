@@ -2,8 +2,14 @@
 LLM Gateway module for abstracting LLM provider interactions.
 """
 
-from .base import BaseLLMProvider, LLMResponse, LLMProviderFactory, Message, MessageRole, EmbeddingResponse
+from .base import (
+    BaseLLMProvider, LLMResponse, LLMProviderFactory, Message, MessageRole, EmbeddingResponse,
+    messages_to_json
+)
 from .dummy_provider import DummyProvider
+from .rate_limit import AsyncRateLimiter
+from .cache import ResponseCache
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "BaseLLMProvider", 
@@ -12,5 +18,9 @@ __all__ = [
     "DummyProvider",
     "Message",
     "MessageRole",
-    "EmbeddingResponse"
+    "EmbeddingResponse",
+    "messages_to_json",
+    "AsyncRateLimiter",
+    "ResponseCache",
+    "SemanticCache"
 ]
@@ -5,10 +5,27 @@ This module provides abstract base classes for LLM provider interactions.
 """
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+import asyncio
+import functools
+import importlib.util
+import inspect
+import sys
+import time
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Callable, Union
 from enum import Enum
 
+from .._compat import DATACLASS_SLOTS, HAS_ORJSON, json_dumps
+from .cache import ResponseCache, make_cache_key
+
+if HAS_ORJSON:
+    import orjson
+
+if TYPE_CHECKING:
+    import numpy as np
+    import httpx
+
 
 class MessageRole(Enum):
     """Message roles for chat-based models."""
@@ -18,7 +35,7 @@ class MessageRole(Enum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Message:
     """
     A single message in a conversation.
@@ -39,7 +56,26 @@ class Message:
         }
 
 
-@dataclass
+def messages_to_json(messages: List[Message]) -> bytes:
+    """
+    Serialize messages as a JSON array of {"role", "content"} objects.
+    
+    Providers should build request bodies with this rather than calling
+    to_dict() per message: with orjson installed the Message dataclasses
+    and their roles are encoded natively, without intermediate dicts.
+    
+    Args:
+        messages: Conversation messages
+        
+    Returns:
+        UTF-8 encoded JSON, equal to encoding [m.to_dict() for m in messages]
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(messages)
+    return json_dumps([message.to_dict() for message in messages])
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LLMResponse:
     """
     Response from an LLM provider.
@@ -64,18 +100,19 @@ class LLMResponse:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EmbeddingResponse:
     """
     Response from an embedding model.
     
     Attributes:
-        embeddings: List of embedding vectors
+        embeddings: List of embedding vectors, or a 2-D numpy array when
+            the provider was asked for one (as_numpy=True)
         model: The model that generated the embeddings
         usage: Token usage information
     """
     
-    embeddings: List[List[float]]
+    embeddings: Union[List[List[float]], "np.ndarray"]
     model: str
     usage: Optional[Dict[str, int]] = None
 
@@ -88,16 +125,51 @@ class BaseLLMProvider(ABC):
     and implement the required methods.
     """
     
-    def __init__(self, api_key: Optional[str] = None, **kwargs):
+    # Whether subclasses' completion() is wrapped with the response cache;
+    # wrappers that delegate to another provider turn this off
+    _cache_completions = True
+    
+    # Seconds a successful validate_connection() is reused, and until when
+    _connection_check_ttl = 60.0
+    _connection_valid_until = 0.0
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        **kwargs
+    ):
         """
         Initialize the LLM provider.
         
         Args:
             api_key: API key for authentication
+            response_cache: Cache for deterministic (temperature 0)
+                completions; a private one is created if None
             **kwargs: Additional provider-specific configuration
         """
         self.api_key = api_key
         self.config = kwargs
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
+        
+        # Pooled HTTP clients, created on first use (see _http / _ahttp)
+        self._http_client: Optional["httpx.Client"] = None
+        self._async_http_client: Optional["httpx.AsyncClient"] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Route each provider's completion() through the response cache and
+        precompute its display name (see get_provider_name).
+        """
+        super().__init_subclass__(**kwargs)
+        cls._provider_display_name = cls.__name__.replace("Provider", "")
+        completion = cls.__dict__.get("completion")
+        if (
+            cls._cache_completions
+            and completion is not None
+            and not getattr(completion, "__isabstractmethod__", False)
+        ):
+            cls.completion = _with_response_cache(completion)
     
     @abstractmethod
     def completion(
@@ -143,6 +215,166 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    def batch_embeddings(
+        self,
+        model: str,
+        texts: List[str],
+        batch_size: int = 256,
+        **kwargs
+    ) -> EmbeddingResponse:
+        """
+        Embed many texts with one embeddings() call per batch_size texts.
+        
+        Embedding endpoints accept many inputs per request, so this sends
+        len(texts) / batch_size requests instead of one per text.
+        
+        Args:
+            model: Embedding model identifier
+            texts: List of texts to embed
+            batch_size: Maximum texts per embeddings() call
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            EmbeddingResponse with one vector per text, in order, and the
+            summed token usage of all batches
+        """
+        if len(texts) <= batch_size:
+            return self.embeddings(model, texts, **kwargs)
+        return _merge_embedding_responses([
+            self.embeddings(model, texts[start:start + batch_size], **kwargs)
+            for start in range(0, len(texts), batch_size)
+        ])
+    
+    async def abatch_embeddings(
+        self,
+        model: str,
+        texts: List[str],
+        batch_size: int = 256,
+        **kwargs
+    ) -> EmbeddingResponse:
+        """
+        Async batch_embeddings(), with the batches requested concurrently.
+        
+        Args:
+            model: Embedding model identifier
+            texts: List of texts to embed
+            batch_size: Maximum texts per aembeddings() call
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            EmbeddingResponse with one vector per text, in order, and the
+            summed token usage of all batches
+        """
+        if len(texts) <= batch_size:
+            return await self.aembeddings(model, texts, **kwargs)
+        return _merge_embedding_responses(await asyncio.gather(*(
+            self.aembeddings(model, texts[start:start + batch_size], **kwargs)
+            for start in range(0, len(texts), batch_size)
+        )))
+    
+    @property
+    def _http(self) -> "httpx.Client":
+        """
+        Shared keep-alive HTTP client for provider requests.
+        
+        Subclasses should send requests through this client (e.g.
+        self._http.post(url, json=..., headers=...)) rather than creating
+        one per call, so connections and TLS sessions are reused.
+        
+        Returns:
+            httpx.Client, created on first access
+        """
+        if self._http_client is None:
+            self._http_client = _create_http_client()
+        return self._http_client
+    
+    @property
+    def _ahttp(self) -> "httpx.AsyncClient":
+        """
+        Async counterpart of _http, for native acompletion() implementations.
+        
+        Returns:
+            httpx.AsyncClient, created on first access
+        """
+        if self._async_http_client is None:
+            self._async_http_client = _create_http_client(asynchronous=True)
+        return self._async_http_client
+    
+    def close(self) -> None:
+        """Close the pooled sync HTTP client, if one was created."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+    
+    async def aclose(self) -> None:
+        """Close both pooled HTTP clients, if they were created."""
+        self.close()
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+    
+    def __enter__(self) -> "BaseLLMProvider":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "BaseLLMProvider":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def acompletion(
+        self,
+        model: str,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a completion without blocking the event loop.
+        
+        The default implementation runs completion() in a worker thread;
+        providers with a native async client should override it.
+        
+        Args:
+            model: Model identifier
+            messages: List of conversation messages
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            LLMResponse with generated content
+        """
+        return await asyncio.to_thread(
+            self.completion, model, messages, temperature, max_tokens, **kwargs
+        )
+    
+    async def aembeddings(
+        self,
+        model: str,
+        texts: List[str],
+        **kwargs
+    ) -> EmbeddingResponse:
+        """
+        Generate embeddings without blocking the event loop.
+        
+        The default implementation runs embeddings() in a worker thread;
+        providers with a native async client should override it.
+        
+        Args:
+            model: Embedding model identifier
+            texts: List of texts to embed
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            EmbeddingResponse with embedding vectors
+        """
+        return await asyncio.to_thread(self.embeddings, model, texts, **kwargs)
+    
     @abstractmethod
     def list_models(self) -> List[str]:
         """
@@ -153,18 +385,40 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    def _ping(self) -> bool:
+        """
+        Probe whether the provider is reachable and the credentials work.
+        
+        The default lists the models, which for HTTP providers downloads and
+        parses the whole model list. Providers should override it with a
+        lighter request, e.g.
+        self._http.head(f"{base_url}/models", timeout=2.0).status_code == 200
+        
+        Returns:
+            True if the provider answered successfully
+        """
+        return len(self.list_models()) > 0
+    
     def validate_connection(self) -> bool:
         """
         Validate that the provider connection is working.
         
+        A successful check is reused for _connection_check_ttl seconds, so
+        repeated health checks do not each make a request.
+        
         Returns:
             True if connection is valid, False otherwise
         """
+        now = time.monotonic()
+        if now < self._connection_valid_until:
+            return True
         try:
-            models = self.list_models()
-            return len(models) > 0
+            valid = self._ping()
         except Exception:
             return False
+        if valid:
+            self._connection_valid_until = now + self._connection_check_ttl
+        return valid
     
     def get_provider_name(self) -> str:
         """
@@ -173,7 +427,145 @@ class BaseLLMProvider(ABC):
         Returns:
             Provider name
         """
-        return self.__class__.__name__.replace("Provider", "")
+        return self._provider_display_name
+
+
+def _create_http_client(asynchronous: bool = False):
+    """
+    Create a pooled httpx client for provider requests.
+    
+    httpx is imported here rather than at module load, so providers that
+    never make HTTP calls (and the pipeline) do not pay for it.
+    
+    Args:
+        asynchronous: Create an httpx.AsyncClient instead of an httpx.Client
+        
+    Returns:
+        Client with keep-alive pool limits, timeouts and HTTP/2 when h2 is
+        installed
+        
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx is required for provider HTTP calls. "
+            "Install it with: pip install 'better-prompt[http]'"
+        ) from None
+    client_class = httpx.AsyncClient if asynchronous else httpx.Client
+    return client_class(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=30.0
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+
+def _merge_embedding_responses(responses: List[EmbeddingResponse]) -> EmbeddingResponse:
+    """
+    Concatenate per-batch embedding responses into one.
+    
+    Args:
+        responses: Responses for consecutive batches of texts
+        
+    Returns:
+        EmbeddingResponse with the batches' vectors in order (an ndarray if
+        the batches returned ndarrays) and their token usage summed
+    """
+    # Imported here so importing the gateway does not pay for NumPy
+    import numpy as np
+    
+    batches = [response.embeddings for response in responses]
+    if isinstance(batches[0], np.ndarray):
+        embeddings = np.concatenate(batches)
+    else:
+        embeddings = [vector for batch in batches for vector in batch]
+    
+    usage: Dict[str, int] = {}
+    for response in responses:
+        for key, value in (response.usage or {}).items():
+            usage[key] = usage.get(key, 0) + value
+    
+    return EmbeddingResponse(embeddings=embeddings, model=responses[0].model, usage=usage)
+
+
+# Provider whose cached completion() is running in the current context. An
+# override that delegates to super().completion() reaches a second wrapper;
+# only the outermost one uses the cache (see _with_response_cache)
+_completion_owner: ContextVar[Optional["BaseLLMProvider"]] = ContextVar(
+    "_completion_owner", default=None
+)
+
+
+def _with_response_cache(completion: Callable) -> Callable:
+    """
+    Wrap a provider's completion() with a lookup in self.response_cache.
+    
+    Only deterministic requests are cached: temperature 0 and not
+    streaming. Pass no_cache=True to bypass the cache for one call.
+    Every class's completion() is wrapped, so when an override calls
+    super().completion() the inner wrappers pass straight through and the
+    outermost call alone reads and fills the cache.
+    
+    Args:
+        completion: The provider's completion method
+        
+    Returns:
+        Wrapped method with the same signature
+    """
+    signature = inspect.signature(completion)
+    var_keyword = next(
+        (name for name, param in signature.parameters.items()
+         if param.kind is inspect.Parameter.VAR_KEYWORD),
+        None
+    )
+    
+    def call(self, *args, **kwargs):
+        token = _completion_owner.set(self)
+        try:
+            return completion(self, *args, **kwargs)
+        finally:
+            _completion_owner.reset(token)
+    
+    @functools.wraps(completion)
+    def cached_completion(self, *args, **kwargs):
+        no_cache = kwargs.pop("no_cache", False)
+        if _completion_owner.get() is self:
+            return completion(self, *args, **kwargs)
+        
+        cache = getattr(self, "response_cache", None)
+        if cache is None or no_cache:
+            return call(self, *args, **kwargs)
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        if var_keyword is not None:
+            params.update(params.pop(var_keyword))
+        for name in ("self", "model", "messages", "temperature", "max_tokens"):
+            params.pop(name, None)
+        
+        arguments = bound.arguments
+        temperature = arguments.get("temperature")
+        if temperature != 0 or params.get("stream"):
+            return call(self, *args, **kwargs)
+        
+        key = make_cache_key(
+            arguments["model"], arguments["messages"], temperature,
+            arguments.get("max_tokens"), params
+        )
+        response = cache.get(key)
+        if response is None:
+            response = call(self, *args, **kwargs)
+            cache.set(key, response)
+        return response
+    
+    return cached_completion
 
 
 class LLMProviderFactory:
@@ -196,7 +588,7 @@ class LLMProviderFactory:
             raise ValueError(
                 f"Provider class must inherit from BaseLLMProvider, got {provider_class}"
             )
-        cls._providers[name.lower()] = provider_class
+        cls._providers[sys.intern(name.lower())] = provider_class
     
     @classmethod
     def create_provider(cls, name: str, **kwargs) -> BaseLLMProvider:
@@ -210,7 +602,8 @@ class LLMProviderFactory:
         Returns:
             BaseLLMProvider instance
         """
-        provider_class = cls._providers.get(name.lower())
+        # Callers usually pass the canonical lowercase name already
+        provider_class = cls._providers.get(name) or cls._providers.get(name.lower())
         if not provider_class:
             raise ValueError(
                 f"Unknown provider: {name}. Available providers: {list(cls._providers.keys())}"
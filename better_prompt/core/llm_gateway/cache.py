@@ -0,0 +1,140 @@
+"""
+LLM Response Cache
+
+An in-memory LRU + TTL cache for provider completions, keyed by a SHA-256
+of the canonicalized request so that equivalent requests share an entry.
+"""
+
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+import unicodedata
+
+if TYPE_CHECKING:
+    from .base import LLMResponse, Message
+
+
+# Parameters that do not change the generated output
+_IGNORED_PARAMS = frozenset({"api_key", "stream", "no_cache", "timeout"})
+
+
+def make_cache_key(
+    model: str,
+    messages: List["Message"],
+    temperature: float,
+    max_tokens: Optional[int],
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build a cache key for a completion request.
+    
+    Message content is NFC-normalized and stripped, roles and the model name
+    are lowercased, and the request is serialized as JSON with sorted keys,
+    so trivially different but equivalent requests hash the same.
+    
+    Args:
+        model: Model identifier
+        messages: Conversation messages
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        params: Additional model parameters; output-neutral ones are ignored
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    request = {
+        "model": model.lower(),
+        "messages": [
+            {
+                "role": message.role.value.lower(),
+                "content": unicodedata.normalize("NFC", message.content).strip()
+            }
+            for message in messages
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if params:
+        request["params"] = {
+            key: value for key, value in params.items() if key not in _IGNORED_PARAMS
+        }
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of LLM responses with per-entry expiry.
+    
+    Responses are copied on the way in and out, so callers can mutate the
+    usage and metadata dicts of what they receive.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds a response stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, 'LLMResponse']]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional["LLMResponse"]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key (see make_cache_key)
+        
+        Returns:
+            Copy of the cached response, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_response(entry[1])
+    
+    def set(self, key: str, response: "LLMResponse") -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key (see make_cache_key)
+            response: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, _copy_response(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached responses and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _copy_response(response: "LLMResponse") -> "LLMResponse":
+    """Copy a response along with its usage and metadata dicts."""
+    return replace(response, usage=dict(response.usage), metadata=dict(response.metadata))
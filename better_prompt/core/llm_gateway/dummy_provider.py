@@ -4,10 +4,33 @@ Dummy LLM Provider
 A mock provider for testing and development purposes.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 import random
 
-from .base import BaseLLMProvider, Message, LLMResponse, EmbeddingResponse
+from .base import BaseLLMProvider, Message, MessageRole, LLMResponse, EmbeddingResponse
+
+
+@lru_cache(maxsize=1024)
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, memoized per text.
+    
+    Chat requests resend the whole conversation (and usually the same
+    system prompt) every turn, so most message contents repeat across calls.
+    str.split() is kept because it beats the non-allocating alternatives
+    (regex finditer, manual scans) in CPython.
+    """
+    return len(text.split())
+
+
+# Mock completion templates; {message:.50} truncates to the first 50 characters
+_MOCK_RESPONSES = (
+    "This is a mock response to: '{message:.50}...'",
+    "I understand you asked about: {message:.30}. Here's a dummy response.",
+    "Mock completion #{count} for your query.",
+    "This is a simulated response from the dummy provider.",
+)
 
 
 class DummyProvider(BaseLLMProvider):
@@ -35,6 +58,8 @@ class DummyProvider(BaseLLMProvider):
         """
         super().__init__(api_key=api_key or "dummy-key", **kwargs)
         self.call_count = 0
+        # Private generator so mock responses never touch the global random state
+        self._rng = random.Random()
     
     def completion(
         self,
@@ -60,22 +85,20 @@ class DummyProvider(BaseLLMProvider):
         self.call_count += 1
         
         # Generate mock response based on last user message
-        user_messages = [m for m in messages if m.role.value == "user"]
-        last_message = user_messages[-1].content if user_messages else "Hello"
-        
-        # Create a simple mock response
-        mock_responses = [
-            f"This is a mock response to: '{last_message[:50]}...'",
-            f"I understand you asked about: {last_message[:30]}. Here's a dummy response.",
-            f"Mock completion #{self.call_count} for your query.",
-            "This is a simulated response from the dummy provider."
-        ]
+        last_message = next(
+            (m.content for m in reversed(messages) if m.role is MessageRole.USER),
+            "Hello"
+        )
         
-        content = random.choice(mock_responses)
+        # Format only the response that was picked
+        content = self._rng.choice(_MOCK_RESPONSES).format(
+            message=last_message,
+            count=self.call_count
+        )
         
         # Mock token usage
-        prompt_tokens = sum(len(m.content.split()) for m in messages) * 2
-        completion_tokens = len(content.split()) * 2
+        prompt_tokens = sum(_count_words(m.content) for m in messages) * 2
+        completion_tokens = _count_words(content) * 2
         
         return LLMResponse(
             content=content,
@@ -105,28 +128,32 @@ class DummyProvider(BaseLLMProvider):
         Args:
             model: Embedding model identifier
             texts: List of texts to embed
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters; as_numpy=True returns the
+                embeddings as a float32 ndarray instead of lists
             
         Returns:
             EmbeddingResponse with mock embedding vectors
         """
+        # Imported here so importing the gateway does not pay for NumPy
+        import numpy as np
+        
         self.call_count += 1
         
-        # Generate random embeddings (dimension 1536 like OpenAI)
+        # Generate random embeddings (dimension 1536 like OpenAI), seeded
+        # by text length for reproducibility. Each distinct length gets its
+        # own generator, so the global random state is left untouched
         embedding_dim = 1536
-        embeddings = []
-        
-        for text in texts:
-            # Use text length as seed for reproducibility
-            random.seed(len(text))
-            embedding = [random.random() for _ in range(embedding_dim)]
-            embeddings.append(embedding)
-        
-        # Reset random seed
-        random.seed()
+        rows = {}
+        for length in {len(text) for text in texts}:
+            rows[length] = np.random.default_rng(length).random(embedding_dim, dtype=np.float32)
+        if texts:
+            matrix = np.stack([rows[len(text)] for text in texts])
+        else:
+            matrix = np.empty((0, embedding_dim), dtype=np.float32)
+        embeddings = matrix if kwargs.get("as_numpy") else matrix.tolist()
         
         # Mock token usage
-        total_tokens = sum(len(text.split()) for text in texts) * 2
+        total_tokens = sum(_count_words(text) for text in texts) * 2
         
         return EmbeddingResponse(
             embeddings=embeddings,
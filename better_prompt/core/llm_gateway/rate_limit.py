@@ -0,0 +1,48 @@
+"""
+Async Rate Limiting
+
+A small rate limiter for spreading provider calls under a requests-per-period
+quota (e.g. a provider's QPM limit) when dispatching them concurrently.
+"""
+
+import asyncio
+
+
+class AsyncRateLimiter:
+    """
+    Spaces out acquisitions so at most max_rate happen per time_period.
+    
+    Each acquire() reserves the next free slot, one every
+    time_period / max_rate seconds, and sleeps until it arrives. Use one
+    limiter per event loop.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            max_rate: Maximum number of acquisitions per time period
+            time_period: Length of the period in seconds (default: 60)
+        """
+        if max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+    
+    async def acquire(self) -> None:
+        """Wait until the next slot under the rate limit is available."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -0,0 +1,225 @@
+"""
+Semantic Response Cache
+
+A provider wrapper that serves a cached completion when a new request is
+a close paraphrase of an earlier one, judged by the cosine similarity of
+the embeddings of their last messages.
+
+The index is an exact inner-product search over a preallocated NumPy
+ring buffer, the same search faiss's IndexFlatIP performs. faiss-cpu is
+in requirements.txt but not among the package's declared dependencies,
+so importing it here would break installs without it; NumPy is declared
+and imported lazily.
+"""
+
+from typing import TYPE_CHECKING, List, Optional
+import threading
+import time
+
+from .base import BaseLLMProvider, EmbeddingResponse, LLMResponse, Message
+from .cache import _copy_response, make_cache_key
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SemanticCache(BaseLLMProvider):
+    """
+    Embedding-similarity cache in front of another provider.
+    
+    Wrap a provider to use it: provider = SemanticCache(OpenAIProvider(...)).
+    Exact repeats are still answered by the wrapped provider's response
+    cache; this layer catches requests whose last message is worded
+    differently but means the same thing. Requests are only compared with
+    earlier ones that match in everything else (model, earlier messages,
+    last message role, temperature and other parameters).
+    
+    As with the exact-match cache, only deterministic requests
+    (temperature 0, not streaming) are cached, and no_cache=True bypasses
+    both layers for one call.
+    """
+    
+    # Exact-match caching is left to the wrapped provider
+    _cache_completions = False
+    
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        embedding_model: str = "text-embedding-3-small",
+        threshold: float = 0.95,
+        maxsize: int = 1_000,
+        ttl: float = 3600.0
+    ):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            provider: Provider to send cache misses (and embeddings) to
+            embedding_model: Model used to embed the last message
+            threshold: Minimum cosine similarity for a cache hit
+            maxsize: Maximum number of cached responses; the oldest is
+                replaced first
+            ttl: Seconds a response stays valid
+        """
+        super().__init__(api_key=provider.api_key, response_cache=provider.response_cache)
+        self.provider = provider
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        
+        # Ring buffer of entries; the arrays are allocated on the first
+        # insert, once the embedding dimension is known
+        self._vectors: Optional["np.ndarray"] = None
+        self._contexts: Optional["np.ndarray"] = None
+        self._expires: Optional["np.ndarray"] = None
+        self._responses: List[Optional[LLMResponse]] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    def completion(
+        self,
+        model: str,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Return a cached completion for a paraphrased request, or call the
+        wrapped provider and cache its response.
+        
+        Args:
+            model: Model identifier
+            messages: List of conversation messages
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional model-specific parameters
+        
+        Returns:
+            LLMResponse with generated content
+        """
+        if kwargs.get("no_cache") or temperature != 0 or kwargs.get("stream") or not messages:
+            return self.provider.completion(model, messages, temperature, max_tokens, **kwargs)
+        
+        last = messages[-1]
+        context = _context_id(make_cache_key(
+            model, [*messages[:-1], Message(role=last.role, content="")],
+            temperature, max_tokens, kwargs
+        ))
+        vector = self._embed(last.content)
+        
+        response = self._lookup(context, vector)
+        if response is not None:
+            return response
+        
+        response = self.provider.completion(model, messages, temperature, max_tokens, **kwargs)
+        self._insert(context, vector, response)
+        return response
+    
+    def _embed(self, text: str) -> "np.ndarray":
+        """Embed text as a unit-length float32 vector."""
+        # Imported here so importing the gateway does not pay for NumPy
+        import numpy as np
+        
+        embedding = self.provider.embeddings(self.embedding_model, [text]).embeddings[0]
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def _lookup(self, context: int, vector: "np.ndarray") -> Optional[LLMResponse]:
+        """
+        Find the most similar live entry with the same context.
+        
+        Args:
+            context: Context id of the request (see _context_id)
+            vector: Unit-length embedding of the last message
+        
+        Returns:
+            Copy of the cached response, or None below the threshold
+        """
+        import numpy as np
+        
+        with self._lock:
+            if self._size:
+                size = self._size
+                candidates = np.flatnonzero(
+                    (self._contexts[:size] == context)
+                    & (self._expires[:size] > time.monotonic())
+                )
+                if candidates.size:
+                    scores = self._vectors[candidates] @ vector
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        self.hits += 1
+                        return _copy_response(self._responses[candidates[best]])
+            self.misses += 1
+            return None
+    
+    def _insert(self, context: int, vector: "np.ndarray", response: LLMResponse) -> None:
+        """Store a response, replacing the oldest entry when full."""
+        import numpy as np
+        
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+                self._contexts = np.zeros(self.maxsize, dtype=np.uint64)
+                self._expires = np.zeros(self.maxsize, dtype=np.float64)
+            slot = self._next
+            self._vectors[slot] = vector
+            self._contexts[slot] = context
+            self._expires[slot] = time.monotonic() + self.ttl
+            self._responses[slot] = _copy_response(response)
+            self._next = (slot + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+    
+    def clear(self) -> None:
+        """Remove all cached responses and reset the hit/miss counters."""
+        with self._lock:
+            self._responses = [None] * self.maxsize
+            self._size = 0
+            self._next = 0
+            if self._expires is not None:
+                self._expires[:] = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def embeddings(
+        self,
+        model: str,
+        texts: List[str],
+        **kwargs
+    ) -> EmbeddingResponse:
+        """Delegate embeddings to the wrapped provider."""
+        return self.provider.embeddings(model, texts, **kwargs)
+    
+    def list_models(self) -> List[str]:
+        """List the wrapped provider's models."""
+        return self.provider.list_models()
+    
+    def validate_connection(self) -> bool:
+        """Validate the wrapped provider's connection."""
+        return self.provider.validate_connection()
+    
+    def get_provider_name(self) -> str:
+        """Get the wrapped provider's name."""
+        return self.provider.get_provider_name()
+    
+    def close(self) -> None:
+        """Close the wrapped provider's HTTP client."""
+        self.provider.close()
+    
+    async def aclose(self) -> None:
+        """Close the wrapped provider's HTTP clients."""
+        await self.provider.aclose()
+
+
+def _context_id(key: str) -> int:
+    """Reduce a hex SHA-256 cache key to a 64-bit id for array comparison."""
+    return int(key[:16], 16)
@@ -2,6 +2,6 @@
 Pipeline orchestration module for coordinating the entire refinement process.
 """
 
-from .orchestrator import PipelineOrchestrator, PipelineResult
+from .orchestrator import PipelineOrchestrator, PipelineResult, BatchStatistics
 
-__all__ = ["PipelineOrchestrator", "PipelineResult"]
+__all__ = ["PipelineOrchestrator", "PipelineResult", "BatchStatistics"]
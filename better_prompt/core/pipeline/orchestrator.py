@@ -6,15 +6,24 @@ classify → format_select → refine → validate
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Dict, List
+from collections import Counter
+from datetime import datetime, timezone
+from functools import partial
+from itertools import chain
+import threading
+import time
 
-from ..classifier.task_classifier import TaskClassifier, TaskClassificationResult
-from ..format_selector.format_selector import FormatSelector, FormatRecommendation, OutputFormat
-from ..refiner.pipeline import RefinementPipeline, RefinementResult, ToneType
+from .._compat import DATACLASS_SLOTS, json_dumps
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from ..classifier.task_classifier import TaskClassifier, TaskClassificationResult
+    from ..format_selector.format_selector import FormatSelector, FormatRecommendation
+    from ..refiner.pipeline import RefinementPipeline, RefinementResult, ToneType
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class PipelineResult:
     """
     Complete result from the Better Prompt pipeline.
@@ -26,16 +35,22 @@ class PipelineResult:
         format_recommendation: Result from format selection
         refinement_result: Result from refinement pipeline
         metadata: Additional pipeline metadata
-        timestamp: When the pipeline was executed
+        timestamp_ns: When the pipeline was executed (ns since the epoch);
+            the timestamp property gives it as an ISO 8601 UTC string
     """
     
     original_prompt: str
     refined_prompt: str
-    task_classification: TaskClassificationResult
-    format_recommendation: FormatRecommendation
-    refinement_result: RefinementResult
+    task_classification: "TaskClassificationResult"
+    format_recommendation: "FormatRecommendation"
+    refinement_result: "RefinementResult"
     metadata: Dict[str, any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> str:
+        """When the pipeline was executed, as an ISO 8601 UTC string."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc).isoformat()
     
     def to_dict(self) -> Dict:
         """Convert result to dictionary format."""
@@ -63,48 +78,111 @@ class PipelineResult:
             "timestamp": self.timestamp
         }
     
-    def get_summary(self) -> str:
-        """Get a human-readable summary of the pipeline execution."""
-        summary_lines = [
-            "=" * 60,
-            "BETTER PROMPT - Pipeline Summary",
-            "=" * 60,
-            "",
-            f"Task Type: {self.task_classification.task_type.value}",
-            f"Confidence: {self.task_classification.confidence:.2%}",
-            "",
-            f"Recommended Format: {self.format_recommendation.recommended_format.value}",
-            f"Format Confidence: {self.format_recommendation.confidence:.2%}",
-            "",
-            "Improvements Made:",
-        ]
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize the result as UTF-8 JSON, using orjson when installed.
         
-        for improvement in self.refinement_result.improvements:
-            summary_lines.append(f"  * {improvement}")  # Changed from •
+        Args:
+            indent: Pretty-print with two-space indentation
         
-        summary_lines.extend([
-            "",
-            "Refinement Stages:",
-        ])
+        Returns:
+            JSON encoding of to_dict()
+        """
+        return json_dumps(self.to_dict(), indent=indent)
+    
+    def get_summary(self) -> str:
+        """Get a human-readable summary of the pipeline execution."""
+        rule = "=" * 60
+        return "\n".join(chain(
+            (
+                rule,
+                "BETTER PROMPT - Pipeline Summary",
+                rule,
+                "",
+                f"Task Type: {self.task_classification.task_type.value}",
+                f"Confidence: {self.task_classification.confidence:.2%}",
+                "",
+                f"Recommended Format: {self.format_recommendation.recommended_format.value}",
+                f"Format Confidence: {self.format_recommendation.confidence:.2%}",
+                "",
+                "Improvements Made:",
+            ),
+            # "*" and "[x]" rather than bullet and check mark glyphs
+            (f"  * {improvement}" for improvement in self.refinement_result.improvements),
+            (
+                "",
+                "Refinement Stages:",
+            ),
+            (f"  [x] {stage}" for stage in self.refinement_result.stages_applied),
+            (
+                "",
+                rule,
+                "ORIGINAL PROMPT:",
+                "-" * 60,
+                self.original_prompt,
+                "",
+                rule,
+                "REFINED PROMPT:",
+                "-" * 60,
+                self.refined_prompt,
+                rule,
+            ),
+        ))
+
+
+class BatchStatistics:
+    """
+    Statistics over a batch of pipeline results, accumulated one result at
+    a time so the results themselves need not be kept.
+    
+    PipelineOrchestrator.get_statistics uses it for a list of results.
+    """
+    
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.task_types: Counter = Counter()
+        self.formats: Counter = Counter()
+        self.task_confidence_sum = 0.0
+        self.format_confidence_sum = 0.0
+        self.total_improvements = 0
+    
+    def add(self, result: PipelineResult) -> None:
+        """
+        Count one result.
         
-        for stage in self.refinement_result.stages_applied:
-            summary_lines.append(f"  [x] {stage}")  # Changed from ✓
+        Args:
+            result: PipelineResult to include
+        """
+        task_classification = result.task_classification
+        format_recommendation = result.format_recommendation
+        self.count += 1
+        self.task_types[task_classification.task_type.value] += 1
+        self.formats[format_recommendation.recommended_format.value] += 1
+        self.task_confidence_sum += task_classification.confidence
+        self.format_confidence_sum += format_recommendation.confidence
+        self.total_improvements += len(result.refinement_result.improvements)
+    
+    def summary(self) -> Dict:
+        """
+        Get the statistics of the results added so far.
         
-        summary_lines.extend([
-            "",
-            "=" * 60,
-            "ORIGINAL PROMPT:",
-            "-" * 60,
-            self.original_prompt,
-            "",
-            "=" * 60,
-            "REFINED PROMPT:",
-            "-" * 60,
-            self.refined_prompt,
-            "=" * 60,
-        ])
+        Returns:
+            Dictionary with statistics (empty if no results were added)
+        """
+        count = self.count
+        if not count:
+            return {}
         
-        return "\n".join(summary_lines)
+        return {
+            "total_prompts": count,
+            "task_type_distribution": dict(self.task_types),
+            "format_distribution": dict(self.formats),
+            "average_task_confidence": round(self.task_confidence_sum / count, 3),
+            "average_format_confidence": round(self.format_confidence_sum / count, 3),
+            "average_improvements_per_prompt": round(self.total_improvements / count, 2),
+            "total_improvements": self.total_improvements
+        }
 
 
 class PipelineOrchestrator:
@@ -117,10 +195,10 @@ class PipelineOrchestrator:
     
     def __init__(
         self,
-        task_classifier: Optional[TaskClassifier] = None,
-        format_selector: Optional[FormatSelector] = None,
-        refinement_pipeline: Optional[RefinementPipeline] = None,
-        default_tone: ToneType = ToneType.PROFESSIONAL
+        task_classifier: Optional["TaskClassifier"] = None,
+        format_selector: Optional["FormatSelector"] = None,
+        refinement_pipeline: Optional["RefinementPipeline"] = None,
+        default_tone: Optional["ToneType"] = None
     ):
         """
         Initialize the pipeline orchestrator.
@@ -129,22 +207,63 @@ class PipelineOrchestrator:
             task_classifier: TaskClassifier instance (creates default if None)
             format_selector: FormatSelector instance (creates default if None)
             refinement_pipeline: RefinementPipeline instance (creates default if None)
-            default_tone: Default tone for refinement
+            default_tone: Default tone for refinement (ToneType.PROFESSIONAL if None)
         """
-        self.task_classifier = task_classifier or TaskClassifier()
-        self.format_selector = format_selector or FormatSelector()
+        # The stage modules are imported on construction, so importing this
+        # module (e.g. for PipelineResult) does not load them
+        from ..refiner.pipeline import RefinementPipeline, ToneType
+        
+        if default_tone is None:
+            default_tone = ToneType.PROFESSIONAL
+        if task_classifier is None:
+            from ..classifier.task_classifier import TaskClassifier
+            task_classifier = TaskClassifier()
+        if format_selector is None:
+            from ..format_selector.format_selector import FormatSelector
+            format_selector = FormatSelector()
+        self.task_classifier = task_classifier
+        self.format_selector = format_selector
         self.refinement_pipeline = refinement_pipeline or RefinementPipeline(target_tone=default_tone)
         self.default_tone = default_tone
+        # Refinement pipelines for other tones, built on first use and reused
+        self._tone_pipelines: Dict["ToneType", "RefinementPipeline"] = {}
+        self._tone_pipelines_lock = threading.Lock()
+    
+    def _pipeline_for(self, tone: Optional["ToneType"]) -> "RefinementPipeline":
+        """
+        Get the refinement pipeline for a tone.
+        
+        The shared pipeline is never retargeted, so concurrent calls with
+        different tones cannot see each other's tone.
+        
+        Args:
+            tone: Desired tone (None uses the shared pipeline)
+            
+        Returns:
+            RefinementPipeline targeting the tone
+        """
+        if not tone or tone == self.refinement_pipeline.target_tone:
+            return self.refinement_pipeline
+        pipeline = self._tone_pipelines.get(tone)
+        if pipeline is None:
+            with self._tone_pipelines_lock:
+                pipeline = self._tone_pipelines.get(tone)
+                if pipeline is None:
+                    from ..refiner.pipeline import RefinementPipeline
+                    pipeline = RefinementPipeline(target_tone=tone)
+                    self._tone_pipelines[tone] = pipeline
+        return pipeline
     
     def process(
         self,
         prompt: str,
         model_name: Optional[str] = None,
         provider: Optional[str] = None,
-        tone: Optional[ToneType] = None,
+        tone: Optional["ToneType"] = None,
         custom_constraints: Optional[List[str]] = None,
         apply_template: bool = True,
-        use_llm_classification: bool = False
+        use_llm_classification: bool = False,
+        task_classification: Optional["TaskClassificationResult"] = None
     ) -> PipelineResult:
         """
         Process a prompt through the complete pipeline.
@@ -157,15 +276,17 @@ class PipelineOrchestrator:
             custom_constraints: Additional constraints to add
             apply_template: Whether to apply format template
             use_llm_classification: Whether to use LLM for task classification
+            task_classification: Precomputed classification for prompt (skips stage 1)
             
         Returns:
             PipelineResult with complete pipeline output
         """
         # Stage 1: Task Classification
-        task_classification = self.task_classifier.classify(
-            prompt=prompt,
-            use_llm_fallback=use_llm_classification
-        )
+        if task_classification is None:
+            task_classification = self.task_classifier.classify(
+                prompt=prompt,
+                use_llm_fallback=use_llm_classification
+            )
         
         # Stage 2: Format Selection
         format_recommendation = self.format_selector.recommend_format(
@@ -175,16 +296,14 @@ class PipelineOrchestrator:
         )
         
         # Stage 3: Refinement
-        # Update tone if specified
-        if tone and tone != self.refinement_pipeline.target_tone:
-            self.refinement_pipeline = RefinementPipeline(target_tone=tone)
+        refinement_pipeline = self._pipeline_for(tone)
         
         # Get template if we should apply it
         template = None
         if apply_template:
             template = format_recommendation.template_skeleton
         
-        refinement_result = self.refinement_pipeline.refine(
+        refinement_result = refinement_pipeline.refine(
             prompt=prompt,
             task_type=task_classification.task_type.value,
             format_template=template,
@@ -214,78 +333,128 @@ class PipelineOrchestrator:
         prompts: List[str],
         model_name: Optional[str] = None,
         provider: Optional[str] = None,
+        max_workers: int = 8,
+        executor: Optional["Executor"] = None,
         **kwargs
     ) -> List[PipelineResult]:
         """
         Process multiple prompts through the pipeline.
         
+        Prompts are processed concurrently on a thread pool, which pays off
+        once stages wait on I/O (e.g. LLM classification); results keep the
+        input order.
+        
         Args:
             prompts: List of prompts to process
             model_name: Target model name
             provider: Provider name
+            max_workers: Threads in the pool created for this batch; 1
+                processes the prompts sequentially
+            executor: Existing executor to run on instead of a new pool
             **kwargs: Additional arguments passed to process()
             
         Returns:
             List of PipelineResult objects
         """
-        results = []
-        for prompt in prompts:
-            result = self.process(
-                prompt=prompt,
-                model_name=model_name,
-                provider=provider,
-                **kwargs
-            )
-            results.append(result)
+        # Classify the whole batch up front, then run the remaining stages
+        classifications = self.task_classifier.classify_batch(
+            prompts,
+            use_llm_fallback=kwargs.get("use_llm_classification", False)
+        )
+        
+        process_one = partial(
+            self._process_classified,
+            model_name=model_name,
+            provider=provider,
+            **kwargs
+        )
         
-        return results
+        if executor is not None:
+            return list(executor.map(process_one, prompts, classifications))
+        if max_workers <= 1 or len(prompts) <= 1:
+            return list(map(process_one, prompts, classifications))
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+            return list(pool.map(process_one, prompts, classifications))
     
-    def get_statistics(self, results: List[PipelineResult]) -> Dict:
+    def _process_classified(
+        self,
+        prompt: str,
+        task_classification: "TaskClassificationResult",
+        **kwargs
+    ) -> PipelineResult:
+        """process() with a precomputed classification, as a positional argument for map()."""
+        return self.process(prompt, task_classification=task_classification, **kwargs)
+    
+    async def aprocess_batch(
+        self,
+        prompts: List[str],
+        model_name: Optional[str] = None,
+        provider: Optional[str] = None,
+        max_concurrency: int = 10,
+        qpm: Optional[float] = None,
+        **kwargs
+    ) -> List[PipelineResult]:
         """
-        Get statistics from a batch of pipeline results.
+        Process multiple prompts concurrently without blocking the event loop.
+        
+        Each prompt runs through process() in a worker thread, with at most
+        max_concurrency in flight; when the pipeline calls out to an LLM,
+        qpm keeps the dispatch rate under the provider's quota.
         
         Args:
-            results: List of PipelineResult objects
+            prompts: List of prompts to process
+            model_name: Target model name
+            provider: Provider name
+            max_concurrency: Maximum number of prompts processed at once
+            qpm: Maximum prompts started per minute (None for no limit)
+            **kwargs: Additional arguments passed to process()
             
         Returns:
-            Dictionary with statistics
+            List of PipelineResult objects, in the same order as prompts
         """
-        if not results:
-            return {}
-        
-        # Task type distribution
-        task_types = {}
-        for result in results:
-            task_type = result.task_classification.task_type.value
-            task_types[task_type] = task_types.get(task_type, 0) + 1
+        # Imported here so sync-only users do not load asyncio on import
+        import asyncio
+        from ..llm_gateway.rate_limit import AsyncRateLimiter
         
-        # Format distribution
-        formats = {}
-        for result in results:
-            format_type = result.format_recommendation.recommended_format.value
-            formats[format_type] = formats.get(format_type, 0) + 1
+        classifications = await asyncio.to_thread(
+            self.task_classifier.classify_batch,
+            prompts,
+            kwargs.get("use_llm_classification", False)
+        )
         
-        # Average confidences
-        avg_task_confidence = sum(
-            r.task_classification.confidence for r in results
-        ) / len(results)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = AsyncRateLimiter(qpm) if qpm else None
         
-        avg_format_confidence = sum(
-            r.format_recommendation.confidence for r in results
-        ) / len(results)
+        async def run(prompt: str, task_classification: "TaskClassificationResult") -> PipelineResult:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await asyncio.to_thread(
+                    self.process,
+                    prompt=prompt,
+                    model_name=model_name,
+                    provider=provider,
+                    task_classification=task_classification,
+                    **kwargs
+                )
         
-        # Average improvements
-        total_improvements = sum(
-            len(r.refinement_result.improvements) for r in results
-        )
-        avg_improvements = total_improvements / len(results)
+        return list(await asyncio.gather(*(
+            run(prompt, task_classification)
+            for prompt, task_classification in zip(prompts, classifications)
+        )))
+    
+    def get_statistics(self, results: List[PipelineResult]) -> Dict:
+        """
+        Get statistics from a batch of pipeline results.
         
-        return {
-            "total_prompts": len(results),
-            "task_type_distribution": task_types,
-            "format_distribution": formats,
-            "average_task_confidence": round(avg_task_confidence, 3),
-            "average_format_confidence": round(avg_format_confidence, 3),
-            "average_improvements_per_prompt": round(avg_improvements, 2),
-            "total_improvements": total_improvements
-        }
+        Args:
+            results: List of PipelineResult objects
+            
+        Returns:
+            Dictionary with statistics
+        """
+        statistics = BatchStatistics()
+        for result in results:
+            statistics.add(result)
+        return statistics.summary()
@@ -5,11 +5,132 @@ This module handles plugin manifest loading and validation.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
-import json
+import copy
+import re
 from enum import Enum
 
+from .._compat import json_dumps, json_loads
+
+
+# "major.minor" or "major.minor.patch"
+_VERSION_RE = re.compile(r"\d+\.\d+(?:\.\d+)?")
+
+
+@lru_cache(maxsize=512)
+def _load_manifest_data(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Read and parse a manifest file, memoized per (path, mtime, size).
+    
+    The modification time and size are part of the key, so an edited file
+    is re-read, even when it is rewritten within the filesystem's
+    timestamp granularity. The returned dict is shared between calls and
+    must not be mutated.
+    
+    Args:
+        path: Manifest file path
+        mtime_ns: The file's st_mtime_ns
+        size: The file's st_size
+        
+    Returns:
+        Parsed manifest data
+    """
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def _read_manifest_data(manifest_path: Path) -> Dict:
+    """
+    Get the parsed contents of a manifest file.
+    
+    Unchanged files are not re-read or re-parsed (see _load_manifest_data),
+    so the returned dict is shared and must not be mutated.
+    
+    Args:
+        manifest_path: Path to the manifest file
+        
+    Returns:
+        Parsed manifest data
+    """
+    try:
+        stat = manifest_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest file not found: {manifest_path}") from None
+    return _load_manifest_data(str(manifest_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _validation_errors(name: str, version: str, entry_point: str) -> List[str]:
+    """
+    Check the required manifest fields (see PluginManifest.validate).
+    
+    When all three fields are strings, results are memoized per
+    (name, version, entry_point), so re-discovering or re-registering an
+    unchanged plugin does not re-validate it.
+    
+    Args:
+        name: Plugin name
+        version: Plugin version
+        entry_point: Entry point module/class
+        
+    Returns:
+        List of validation errors (empty if valid)
+    """
+    if type(name) is str and type(version) is str and type(entry_point) is str:
+        return list(_cached_validation_errors(name, version, entry_point))
+    # Other values come from malformed manifests and may be unhashable
+    return list(_cached_validation_errors.__wrapped__(name, version, entry_point))
+
+
+@lru_cache(maxsize=512)
+def _cached_validation_errors(name: str, version: str, entry_point: str) -> Tuple[str, ...]:
+    """Validate the required manifest fields; a tuple, so callers can't mutate it."""
+    errors = []
+    
+    # Check required fields
+    if not name:
+        errors.append("Plugin name is required")
+    
+    if not version:
+        errors.append("Plugin version is required")
+    
+    if not entry_point:
+        errors.append("Entry point is required")
+    
+    # Validate version format (simple check)
+    if version and _VERSION_RE.fullmatch(version) is None:
+        errors.append(f"Invalid version format: {version}")
+    
+    return tuple(errors)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _copy_json(value: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dicts, lists and scalars).
+    
+    Parsed manifests only contain these types, and copying them directly
+    is a few times faster than copy.deepcopy's memo bookkeeping. Anything
+    else, including dict and list subclasses, falls back to deepcopy.
+    
+    Args:
+        value: Value to copy
+        
+    Returns:
+        Independent copy of value
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_json(item) for item in value]
+    if value_type in _JSON_SCALARS:
+        return value
+    return copy.deepcopy(value)
+
 
 class PluginType(Enum):
     """Types of plugins supported."""
@@ -22,6 +143,24 @@ class PluginType(Enum):
     CUSTOM = "custom"
 
 
+def _plugin_type(data: Dict) -> PluginType:
+    """
+    Get the plugin type from manifest data, defaulting to CUSTOM.
+    
+    Args:
+        data: Dictionary containing manifest data
+        
+    Returns:
+        PluginType named by data["plugin_type"], or CUSTOM if unknown
+    """
+    # Convert plugin_type string to enum
+    plugin_type_str = data.get("plugin_type", "custom")
+    try:
+        return PluginType(plugin_type_str.lower())
+    except ValueError:
+        return PluginType.CUSTOM
+
+
 @dataclass
 class PluginManifest:
     """
@@ -59,23 +198,26 @@ class PluginManifest:
             
         Returns:
             PluginManifest instance
+            
+        Raises:
+            TypeError: If dependencies is not a list
         """
-        # Convert plugin_type string to enum
-        plugin_type_str = data.get("plugin_type", "custom")
-        try:
-            plugin_type = PluginType(plugin_type_str.lower())
-        except ValueError:
-            plugin_type = PluginType.CUSTOM
+        dependencies = data.get("dependencies", [])
+        if not isinstance(dependencies, list):
+            # list() would accept any iterable, splitting a string into characters
+            raise TypeError(
+                f"Manifest dependencies must be a list, not {type(dependencies).__name__}"
+            )
         
         return cls(
             name=data["name"],
             version=data["version"],
-            plugin_type=plugin_type,
+            plugin_type=_plugin_type(data),
             description=data.get("description", ""),
             author=data.get("author", "Unknown"),
             entry_point=data["entry_point"],
-            dependencies=data.get("dependencies", []),
-            config=data.get("config", {}),
+            dependencies=list(dependencies),
+            config=_copy_json(data.get("config", {})),
             enabled=data.get("enabled", True)
         )
     
@@ -90,13 +232,8 @@ class PluginManifest:
         Returns:
             PluginManifest instance
         """
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Manifest file not found: {manifest_path}")
-        
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return cls.from_dict(data)
+        # from_dict copies the mutable fields, so the cached data stays intact
+        return cls.from_dict(_read_manifest_data(manifest_path))
     
     def to_dict(self) -> Dict:
         """
@@ -125,9 +262,7 @@ class PluginManifest:
             manifest_path: Path where to save the manifest
         """
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        manifest_path.write_bytes(json_dumps(self.to_dict(), indent=True))
     
     def validate(self) -> List[str]:
         """
@@ -136,23 +271,7 @@ class PluginManifest:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        
-        # Check required fields
-        if not self.name:
-            errors.append("Plugin name is required")
-        
-        if not self.version:
-            errors.append("Plugin version is required")
-        
-        if not self.entry_point:
-            errors.append("Entry point is required")
-        
-        # Validate version format (simple check)
-        if self.version and not self._is_valid_version(self.version):
-            errors.append(f"Invalid version format: {self.version}")
-        
-        return errors
+        return _validation_errors(self.name, self.version, self.entry_point)
     
     @staticmethod
     def _is_valid_version(version: str) -> bool:
@@ -165,16 +284,7 @@ class PluginManifest:
         Returns:
             True if valid, False otherwise
         """
-        parts = version.split('.')
-        if len(parts) < 2 or len(parts) > 3:
-            return False
-        
-        try:
-            for part in parts:
-                int(part)
-            return True
-        except ValueError:
-            return False
+        return _VERSION_RE.fullmatch(version) is not None
     
     def __str__(self) -> str:
         """String representation of the manifest."""
@@ -4,12 +4,131 @@ Plugin Registry Module
 This module manages plugin discovery, loading, and lifecycle.
 """
 
-from typing import Dict, List, Optional, Type
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 from pathlib import Path
+from types import ModuleType
+import importlib
 import importlib.util
+import os
 import sys
 
-from .manifest import PluginManifest, PluginType
+from .._compat import DATACLASS_SLOTS
+from .manifest import PluginManifest, PluginType, _read_manifest_data, _validation_errors
+
+
+_MANIFEST_FILENAME = "manifest.json"
+
+# Fewer manifests than this are parsed serially; thread startup would
+# cost more than it saves
+_PARALLEL_DISCOVERY_THRESHOLD = 8
+
+# Directories never searched for manifests (besides hidden ones)
+_SKIPPED_DIRECTORIES = frozenset({"node_modules", "__pycache__"})
+
+
+def _find_manifests(directory: Path) -> Iterator[Path]:
+    """
+    Find manifest files under a directory in a single scandir walk.
+    
+    Directories are visited depth-first in the same order as
+    Path.rglob(), without following symlinked directories. Hidden
+    directories and those in _SKIPPED_DIRECTORIES are pruned.
+    
+    Args:
+        directory: Root directory to search
+        
+    Yields:
+        Paths of manifest files
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                subdirectories = []
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith(".") and name not in _SKIPPED_DIRECTORIES:
+                            subdirectories.append(entry.path)
+                    elif name == _MANIFEST_FILENAME and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirectories))
+
+
+def _try_read_manifest_data(manifest_path: Path) -> Tuple[Optional[Dict], Optional[Exception]]:
+    """
+    Read a manifest, returning the error instead of raising it.
+    
+    Args:
+        manifest_path: Path to the manifest file
+        
+    Returns:
+        (parsed data, None) on success, (None, exception) on failure
+    """
+    try:
+        return _read_manifest_data(manifest_path), None
+    except Exception as e:
+        return None, e
+
+
+def _import_lazily(module_path: str) -> ModuleType:
+    """
+    Import a module whose code runs on first attribute access.
+    
+    A module that is already imported is returned as is. Errors raised
+    by the module's own code surface at that first access rather than
+    here; a module that cannot be found still raises immediately.
+    
+    Args:
+        module_path: Dotted module path
+        
+    Returns:
+        The (possibly not yet executed) module
+    """
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return module
+    
+    spec = importlib.util.find_spec(module_path)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_path}'", name=module_path)
+    if not hasattr(spec.loader, "exec_module"):
+        # LazyLoader needs exec_module; legacy loaders import eagerly
+        return importlib.import_module(module_path)
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_path] = module
+    loader.exec_module(module)
+    
+    # Bind a submodule on its parent package, as the import system does
+    # (find_spec has already imported the parent)
+    parent, _, child = module_path.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _PluginRecord:
+    """
+    Everything the registry holds for one plugin.
+    
+    Attributes:
+        manifest: The plugin's manifest
+        plugin_type: The manifest's plugin type when it was registered
+        module: Loaded module or plugin class, once loaded
+        instance: Cached plugin instance, once created
+    """
+    
+    manifest: PluginManifest
+    plugin_type: PluginType
+    module: Any = None
+    instance: Any = None
 
 
 class PluginRegistry:
@@ -27,9 +146,12 @@ class PluginRegistry:
             plugin_directories: List of directories to search for plugins
         """
         self.plugin_directories = plugin_directories or []
-        self._plugins: Dict[str, PluginManifest] = {}
-        self._loaded_modules: Dict[str, any] = {}
-        self._instances: Dict[str, any] = {}
+        # One record per plugin, so a lookup by name finds the manifest,
+        # module and instance together
+        self._records: Dict[str, _PluginRecord] = {}
+        # Names of the plugins of each type, in registration order (dicts
+        # used as ordered sets), so list_plugins by type skips the others
+        self._by_type: Dict[PluginType, Dict[str, None]] = {}
     
     def add_plugin_directory(self, directory: Path) -> None:
         """
@@ -41,39 +163,91 @@ class PluginRegistry:
         if directory not in self.plugin_directories:
             self.plugin_directories.append(directory)
     
-    def discover_plugins(self) -> int:
+    def discover_plugins(self, max_workers: int = 1) -> int:
         """
         Discover all plugins in the registered directories.
         
+        With max_workers > 1, manifest files are read and parsed on a
+        thread pool; plugins are still registered afterwards, in discovery
+        order, on the calling thread. This pays off when reads block (slow
+        or network filesystems); with manifests in the page cache, parsing
+        holds the GIL and a single thread is faster.
+        
+        Args:
+            max_workers: Threads used to read manifests
+        
         Returns:
             Number of plugins discovered
         """
+        manifest_paths = [
+            manifest_path
+            for directory in self.plugin_directories
+            if directory.exists()
+            for manifest_path in _find_manifests(directory)
+        ]
+        
+        if max_workers > 1 and len(manifest_paths) >= _PARALLEL_DISCOVERY_THRESHOLD:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                loaded = list(pool.map(_try_read_manifest_data, manifest_paths))
+        else:
+            loaded = list(map(_try_read_manifest_data, manifest_paths))
+        
         discovered_count = 0
         
-        for directory in self.plugin_directories:
-            if not directory.exists():
-                continue
-            
-            # Look for manifest.json files
-            for manifest_path in directory.rglob("manifest.json"):
-                try:
-                    manifest = PluginManifest.from_file(manifest_path)
-                    
-                    # Validate manifest
-                    errors = manifest.validate()
-                    if errors:
-                        print(f"Warning: Invalid manifest at {manifest_path}: {errors}")
-                        continue
-                    
-                    # Register the plugin
-                    self._plugins[manifest.name] = manifest
-                    discovered_count += 1
-                    
-                except Exception as e:
-                    print(f"Error loading manifest from {manifest_path}: {e}")
+        for manifest_path, (data, error) in zip(manifest_paths, loaded):
+            try:
+                if error is not None:
+                    raise error
+                
+                # Validate manifest
+                errors = _validation_errors(data["name"], data["version"], data["entry_point"])
+                if errors:
+                    print(f"Warning: Invalid manifest at {manifest_path}: {errors}")
+                    continue
+                
+                # Build the manifest here, so a malformed one (e.g. a
+                # non-list "dependencies") is skipped rather than breaking
+                # every later listing
+                manifest = PluginManifest.from_dict(data)
+                
+                # Register the plugin
+                self._register(manifest.name, manifest)
+                discovered_count += 1
+                
+            except Exception as e:
+                print(f"Error loading manifest from {manifest_path}: {e}")
         
         return discovered_count
     
+    def _register(self, plugin_name: str, manifest: PluginManifest) -> None:
+        """
+        Add a plugin, or replace the manifest of an already registered one.
+        
+        Args:
+            plugin_name: Name of the plugin
+            manifest: Plugin manifest
+        """
+        plugin_type = manifest.plugin_type
+        
+        record = self._records.get(plugin_name)
+        if record is None:
+            # Interned so equal names from separate manifests share one string
+            plugin_name = sys.intern(plugin_name)
+            self._records[plugin_name] = _PluginRecord(manifest, plugin_type)
+            self._by_type.setdefault(plugin_type, {})[plugin_name] = None
+            return
+        
+        record.manifest = manifest
+        if plugin_type is not record.plugin_type:
+            del self._by_type[record.plugin_type][plugin_name]
+            record.plugin_type = plugin_type
+            # The plugin keeps its registration position, so rebuild the
+            # bucket in registration order rather than appending to it
+            names = self._by_type.get(plugin_type, {})
+            names[plugin_name] = None
+            self._by_type[plugin_type] = {name: None for name in self._records if name in names}
+    
     def register_plugin(self, manifest: PluginManifest) -> None:
         """
         Manually register a plugin.
@@ -85,7 +259,7 @@ class PluginRegistry:
         if errors:
             raise ValueError(f"Invalid plugin manifest: {errors}")
         
-        self._plugins[manifest.name] = manifest
+        self._register(manifest.name, manifest)
     
     def unregister_plugin(self, plugin_name: str) -> bool:
         """
@@ -97,17 +271,12 @@ class PluginRegistry:
         Returns:
             True if plugin was unregistered, False if not found
         """
-        if plugin_name in self._plugins:
-            # Clean up loaded module and instance
-            if plugin_name in self._loaded_modules:
-                del self._loaded_modules[plugin_name]
-            if plugin_name in self._instances:
-                del self._instances[plugin_name]
-            
-            del self._plugins[plugin_name]
-            return True
-        
-        return False
+        # Dropping the record also drops its loaded module and instance
+        record = self._records.pop(plugin_name, None)
+        if record is None:
+            return False
+        del self._by_type[record.plugin_type][plugin_name]
+        return True
     
     def load_plugin(self, plugin_name: str) -> any:
         """
@@ -119,14 +288,15 @@ class PluginRegistry:
         Returns:
             Loaded plugin module
         """
-        if plugin_name not in self._plugins:
+        record = self._records.get(plugin_name)
+        if record is None:
             raise ValueError(f"Plugin not found: {plugin_name}")
         
         # Return cached module if already loaded
-        if plugin_name in self._loaded_modules:
-            return self._loaded_modules[plugin_name]
+        if record.module is not None:
+            return record.module
         
-        manifest = self._plugins[plugin_name]
+        manifest = record.manifest
         
         if not manifest.enabled:
             raise RuntimeError(f"Plugin is disabled: {plugin_name}")
@@ -143,17 +313,21 @@ class PluginRegistry:
                 module_path = manifest.entry_point
                 class_name = None
             
-            # Import the module
-            module = importlib.import_module(module_path)
+            # Import the module. A plugin class is looked up right away, which
+            # runs the module; a bare module entry point runs on first use
+            if class_name:
+                module = importlib.import_module(module_path)
+            else:
+                module = _import_lazily(module_path)
             
             # Get the class if specified
             if class_name:
                 plugin_class = getattr(module, class_name)
-                self._loaded_modules[plugin_name] = plugin_class
+                record.module = plugin_class
             else:
-                self._loaded_modules[plugin_name] = module
+                record.module = module
             
-            return self._loaded_modules[plugin_name]
+            return record.module
             
         except Exception as e:
             raise RuntimeError(f"Failed to load plugin {plugin_name}: {e}")
@@ -170,19 +344,20 @@ class PluginRegistry:
             Plugin instance
         """
         # Return cached instance if exists
-        if plugin_name in self._instances:
-            return self._instances[plugin_name]
+        record = self._records.get(plugin_name)
+        if record is not None and record.instance is not None:
+            return record.instance
         
         # Load the plugin
         plugin_class = self.load_plugin(plugin_name)
         
         # Create instance
-        manifest = self._plugins[plugin_name]
+        manifest = self._records[plugin_name].manifest
         config = {**manifest.config, **kwargs}
         
         try:
             instance = plugin_class(**config)
-            self._instances[plugin_name] = instance
+            record.instance = instance
             return instance
         except Exception as e:
             raise RuntimeError(f"Failed to instantiate plugin {plugin_name}: {e}")
@@ -202,10 +377,13 @@ class PluginRegistry:
         Returns:
             List of plugin manifests
         """
-        plugins = list(self._plugins.values())
-        
         if plugin_type:
-            plugins = [p for p in plugins if p.plugin_type == plugin_type]
+            # Types are indexed as registered; re-register a plugin after
+            # changing its manifest's plugin_type
+            names = self._by_type.get(plugin_type, ())
+            plugins = [self._records[plugin_name].manifest for plugin_name in names]
+        else:
+            plugins = [record.manifest for record in self._records.values()]
         
         if enabled_only:
             plugins = [p for p in plugins if p.enabled]
@@ -222,7 +400,8 @@ class PluginRegistry:
         Returns:
             PluginManifest or None if not found
         """
-        return self._plugins.get(plugin_name)
+        record = self._records.get(plugin_name)
+        return record.manifest if record is not None else None
     
     def enable_plugin(self, plugin_name: str) -> bool:
         """
@@ -234,8 +413,8 @@ class PluginRegistry:
         Returns:
             True if plugin was enabled, False if not found
         """
-        if plugin_name in self._plugins:
-            self._plugins[plugin_name].enabled = True
+        if plugin_name in self._records:
+            self._records[plugin_name].manifest.enabled = True
             return True
         return False
     
@@ -249,12 +428,11 @@ class PluginRegistry:
         Returns:
             True if plugin was disabled, False if not found
         """
-        if plugin_name in self._plugins:
-            self._plugins[plugin_name].enabled = False
+        if plugin_name in self._records:
+            self._records[plugin_name].manifest.enabled = False
             
             # Clean up loaded instance
-            if plugin_name in self._instances:
-                del self._instances[plugin_name]
+            self._records[plugin_name].instance = None
             
             return True
         return False
@@ -266,13 +444,14 @@ class PluginRegistry:
         Returns:
             Dictionary with statistics
         """
-        total_plugins = len(self._plugins)
-        enabled_plugins = sum(1 for p in self._plugins.values() if p.enabled)
-        loaded_plugins = len(self._loaded_modules)
+        manifests = [record.manifest for record in self._records.values()]
+        total_plugins = len(manifests)
+        enabled_plugins = sum(1 for p in manifests if p.enabled)
+        loaded_plugins = sum(1 for record in self._records.values() if record.module is not None)
         
         # Count by type
         by_type = {}
-        for plugin in self._plugins.values():
+        for plugin in manifests:
             plugin_type = plugin.plugin_type.value
             by_type[plugin_type] = by_type.get(plugin_type, 0) + 1
         
@@ -286,9 +465,8 @@ class PluginRegistry:
     
     def clear(self) -> None:
         """Clear all plugins from the registry."""
-        self._plugins.clear()
-        self._loaded_modules.clear()
-        self._instances.clear()
+        self._records.clear()
+        self._by_type.clear()
 
 
 # Global registry instance
@@ -2,6 +2,6 @@
 Refinement pipeline module for multi-stage prompt enhancement.
 """
 
-from .pipeline import RefinementPipeline, RefinementResult, ToneType
+from .pipeline import RefinementPipeline, RefinementContext, RefinementResult, ToneType
 
-__all__ = ["RefinementPipeline", "RefinementResult", "ToneType"]
+__all__ = ["RefinementPipeline", "RefinementContext", "RefinementResult", "ToneType"]
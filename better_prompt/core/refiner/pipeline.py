@@ -6,10 +6,153 @@ for cleanup, expansion, tone adjustment, token optimization, template applicatio
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Callable
 from enum import Enum
+from functools import lru_cache
 import re
 
+from .._compat import DATACLASS_SLOTS
+
+
+# Patterns used by the refinement stages, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+# Once whitespace is collapsed, punctuation has at most one space on each
+# side; this removes the one before and normalizes the one after
+_PUNCTUATION_SPACING_RE = re.compile(r' ?([.,!?;:]) ?')
+# Punctuation that _PUNCTUATION_SPACING_RE would change: a space before it
+# or anything but a single space after it
+_MISSPACED_PUNCTUATION_RE = re.compile(r' [.,!?;:]|[.,!?;:](?! )')
+
+# Substitutions for _replace_phrases: (lowercase phrases the pattern needs,
+# case-insensitive pattern, replacement), applied in order
+_CASUAL_WORDS = (
+    (
+        ("kinda", "sorta", "gonna", "wanna"),
+        re.compile(r'\b(kinda|sorta|gonna|wanna)\b', re.IGNORECASE),
+        '',
+    ),
+)
+
+# Formal phrase -> casual replacement
+_CASUAL_REPLACEMENTS = tuple(
+    ((formal,), re.compile(formal, re.IGNORECASE), casual)
+    for formal, casual in (
+        ("please provide", "can you give me"),
+        ("kindly", ""),
+        ("request", "ask for"),
+    )
+)
+
+# Contraction -> expanded form
+_CONTRACTIONS = tuple(
+    ((contraction,), re.compile(contraction, re.IGNORECASE), formal)
+    for contraction, formal in (
+        ("don't", "do not"),
+        ("can't", "cannot"),
+        ("won't", "will not"),
+        ("shouldn't", "should not"),
+        ("wouldn't", "would not"),
+    )
+)
+
+_REDUNDANT_WORD_PATTERNS = (
+    re.compile(r'\b(very|really|quite|rather)\s+', re.IGNORECASE),  # Intensifiers
+    re.compile(r'\b(just|simply|basically|actually)\s+', re.IGNORECASE),  # Filler words
+    re.compile(r'\bthat\s+', re.IGNORECASE),  # Unnecessary "that"
+)
+
+_PLACEHOLDER_RE = re.compile(r'\{\{[^}]+\}\}')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# Constraints added for each task type by _expand_constraints
+_TASK_CONSTRAINTS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "code_generation": (
+        "Please include comments explaining the logic.",
+        "Follow best practices and coding standards.",
+        "Ensure the code is production-ready."
+    ),
+    "image_generation": (
+        "Specify the desired style, mood, and composition.",
+        "Include details about colors, lighting, and perspective."
+    ),
+    "research": (
+        "Provide sources and citations where applicable.",
+        "Include both overview and detailed analysis."
+    ),
+    "story_writing": (
+        "Develop characters with depth and motivation.",
+        "Include vivid descriptions and engaging dialogue."
+    ),
+    "sql_query": (
+        "Optimize for performance.",
+        "Include comments explaining complex joins or subqueries."
+    ),
+    "data_analysis": (
+        "Provide statistical insights and visualizations if applicable.",
+        "Explain methodology and assumptions."
+    ),
+})
+
+
+def _replace_phrases(prompt: str, replacements: tuple) -> str:
+    """
+    Apply case-insensitive substitutions in order.
+    
+    Most prompts contain none of the phrases, so for ASCII prompts a
+    substring check on the lowercased prompt skips each pattern that
+    cannot match, instead of running the regex over the whole prompt.
+    The check is exact for ASCII; re.IGNORECASE also folds a few
+    non-ASCII letters (e.g. "ſ" matches "s"), so other prompts run every
+    pattern.
+    
+    Args:
+        prompt: Prompt to transform
+        replacements: (phrases, pattern, replacement) entries (see
+            _CASUAL_WORDS)
+        
+    Returns:
+        Transformed prompt
+    """
+    lowered = prompt.lower() if prompt.isascii() else None
+    for phrases, pattern, replacement in replacements:
+        if lowered is not None and not any(phrase in lowered for phrase in phrases):
+            continue
+        prompt = pattern.sub(replacement, prompt)
+        if lowered is not None:
+            lowered = prompt.lower()
+    return prompt
+
+
+def _is_clean(prompt: str) -> bool:
+    """
+    Check whether the cleanup substitutions would leave prompt unchanged.
+    
+    Conservative: a prompt ending in a space is reported as not clean even
+    when the substitutions would keep it (e.g. "Done. "), which only costs
+    running them.
+    
+    Args:
+        prompt: Prompt to check
+    
+    Returns:
+        True if the whitespace and punctuation passes can be skipped
+    """
+    # isprintable() is False for every whitespace character except " "
+    return (
+        "  " not in prompt
+        and prompt.isprintable()
+        and not prompt.startswith(" ")
+        and not prompt.endswith(" ")
+        and _MISSPACED_PUNCTUATION_RE.search(prompt) is None
+    )
+
+
+@lru_cache(maxsize=None)
+def _stage_name(function_name: str) -> str:
+    """Display name of a stage method, e.g. "_expand_constraints" -> "Expand Constraints"."""
+    return function_name.replace("_", " ").title()
+
 
 class ToneType(Enum):
     """Supported tone types for prompts."""
@@ -21,9 +164,13 @@ class ToneType(Enum):
     FORMAL = "formal"
     FRIENDLY = "friendly"
     NEUTRAL = "neutral"
+    
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent and runs in C, unlike Enum.__hash__ (hash of the name)
+    __hash__ = object.__hash__
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RefinementResult:
     """
     Result of the refinement pipeline.
@@ -43,6 +190,35 @@ class RefinementResult:
     improvements: List[str] = field(default_factory=list)
 
 
+@dataclass(**DATACLASS_SLOTS)
+class RefinementContext:
+    """
+    State threaded through the refinement stages.
+    
+    Each stage takes the context, updates current_prompt, improvements and
+    its own metadata entry, and returns it.
+    
+    Attributes:
+        original_prompt: The original input prompt
+        current_prompt: The prompt as refined so far
+        task_type: Type of task (for context-aware refinement)
+        format_template: Template to apply, if any
+        custom_constraints: Additional constraints to add
+        improvements: Improvements made so far
+        stages_applied: Stages applied so far
+        metadata: Metadata from each stage, keyed by stage
+    """
+    
+    original_prompt: str
+    current_prompt: str
+    task_type: Optional[str] = None
+    format_template: Optional[str] = None
+    custom_constraints: List[str] = field(default_factory=list)
+    improvements: List[str] = field(default_factory=list)
+    stages_applied: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
 class RefinementPipeline:
     """
     Multi-stage prompt refinement pipeline.
@@ -56,6 +232,18 @@ class RefinementPipeline:
     6. Validate - Ensure quality and completeness
     """
     
+    # Method applying each tone in _adjust_tone; NEUTRAL leaves the prompt
+    # as is. Looked up by name (rather than bound in __init__) so that
+    # target_tone can be reassigned and subclasses can override the methods
+    _TONE_TRANSFORMS: Dict[ToneType, str] = {
+        ToneType.PROFESSIONAL: "_make_professional",
+        ToneType.CASUAL: "_make_casual",
+        ToneType.TECHNICAL: "_make_technical",
+        ToneType.CREATIVE: "_make_creative",
+        ToneType.FORMAL: "_make_formal",
+        ToneType.FRIENDLY: "_make_friendly",
+    }
+    
     def __init__(self, target_tone: ToneType = ToneType.NEUTRAL):
         """
         Initialize the refinement pipeline.
@@ -64,7 +252,7 @@ class RefinementPipeline:
             target_tone: Desired tone for the refined prompt
         """
         self.target_tone = target_tone
-        self.stages: List[Callable] = [
+        self.stages: List[Callable[[RefinementContext], RefinementContext]] = [
             self._cleanup,
             self._expand_constraints,
             self._adjust_tone,
@@ -90,41 +278,64 @@ class RefinementPipeline:
         Returns:
             RefinementResult with refined prompt and metadata
         """
-        context = {
-            "original_prompt": prompt,
-            "current_prompt": prompt,
-            "task_type": task_type,
-            "format_template": format_template,
-            "custom_constraints": custom_constraints or [],
-            "improvements": [],
-            "stages_applied": [],
-            "metadata": {}
-        }
+        context = RefinementContext(
+            original_prompt=prompt,
+            current_prompt=prompt,
+            task_type=task_type,
+            format_template=format_template,
+            custom_constraints=custom_constraints or []
+        )
         
         # Apply each refinement stage
         for stage in self.stages:
-            stage_name = stage.__name__.replace("_", " ").title()
             context = stage(context)
-            context["stages_applied"].append(stage_name)
+            context.stages_applied.append(_stage_name(stage.__name__))
         
         # Apply template if provided
         if format_template:
             context = self._apply_template(context)
-            context["stages_applied"].append("Apply Template")
+            context.stages_applied.append("Apply Template")
         
         # Validate the result
         context = self._validate(context)
-        context["stages_applied"].append("Validate")
+        context.stages_applied.append("Validate")
         
         return RefinementResult(
-            refined_prompt=context["current_prompt"],
-            original_prompt=context["original_prompt"],
-            stages_applied=context["stages_applied"],
-            metadata=context["metadata"],
-            improvements=context["improvements"]
+            refined_prompt=context.current_prompt,
+            original_prompt=context.original_prompt,
+            stages_applied=context.stages_applied,
+            metadata=context.metadata,
+            improvements=context.improvements
         )
     
-    def _cleanup(self, context: Dict) -> Dict:
+    def refine_batch(
+        self,
+        prompts: List[str],
+        task_type: Optional[str] = None,
+        format_template: Optional[str] = None,
+        custom_constraints: Optional[List[str]] = None
+    ) -> List[RefinementResult]:
+        """
+        Run the full refinement pipeline on several prompts.
+        
+        Each prompt is refined independently, exactly as by refine(), with
+        the same task type, template and constraints.
+        
+        Args:
+            prompts: The original prompts to refine
+            task_type: Type of task (for context-aware refinement)
+            format_template: Optional template to apply
+            custom_constraints: Additional constraints to add
+        
+        Returns:
+            List of RefinementResult, in the same order as prompts
+        """
+        return [
+            self.refine(prompt, task_type, format_template, custom_constraints)
+            for prompt in prompts
+        ]
+    
+    def _cleanup(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 1: Clean up the prompt by removing noise and fixing formatting.
         
@@ -134,29 +345,26 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        prompt = context["current_prompt"]
+        prompt = context.current_prompt
         original = prompt
         
-        # Remove excessive whitespace
-        prompt = re.sub(r'\s+', ' ', prompt)
-        
-        # Remove leading/trailing whitespace
-        prompt = prompt.strip()
-        
-        # Fix common typos and formatting issues
-        prompt = re.sub(r'\s+([.,!?;:])', r'\1', prompt)  # Remove space before punctuation
-        prompt = re.sub(r'([.,!?;:])\s*', r'\1 ', prompt)  # Add space after punctuation
-        prompt = prompt.replace('  ', ' ')  # Remove double spaces
+        if not _is_clean(prompt):
+            # Remove excessive and leading/trailing whitespace
+            prompt = _WHITESPACE_RE.sub(' ', prompt).strip()
+            
+            # Fix spacing around punctuation: none before, exactly one after.
+            # Both passes leave single spaces, so no double spaces remain
+            prompt = _PUNCTUATION_SPACING_RE.sub(r'\1 ', prompt)
         
         # Capitalize first letter
         if prompt and not prompt[0].isupper():
             prompt = prompt[0].upper() + prompt[1:]
         
         if prompt != original:
-            context["improvements"].append("Cleaned up formatting and whitespace")
+            context.improvements.append("Cleaned up formatting and whitespace")
         
-        context["current_prompt"] = prompt
-        context["metadata"]["cleanup"] = {
+        context.current_prompt = prompt
+        context.metadata["cleanup"] = {
             "original_length": len(original),
             "cleaned_length": len(prompt),
             "changes_made": prompt != original
@@ -164,7 +372,7 @@ class RefinementPipeline:
         
         return context
     
-    def _expand_constraints(self, context: Dict) -> Dict:
+    def _expand_constraints(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 2: Expand the prompt with additional constraints and context.
         
@@ -174,10 +382,10 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        prompt = context["current_prompt"]
-        task_type = context.get("task_type")
-        custom_constraints = context.get("custom_constraints", [])
-        has_template = context.get("format_template") is not None
+        prompt = context.current_prompt
+        task_type = context.task_type
+        custom_constraints = context.custom_constraints
+        has_template = context.format_template is not None
         
         additions = []
         
@@ -194,19 +402,18 @@ class RefinementPipeline:
         # Only append constraints to prompt if NO template will be used
         # If template exists, constraints will be shown in the template's Constraints section
         if additions and not has_template:
-            constraint_text = " ".join(additions)
-            prompt = f"{prompt} {constraint_text}"
-            context["improvements"].append(
+            prompt = " ".join((prompt, *additions))
+            context.improvements.append(
                 f"Added {len(additions)} constraint(s) for clarity and specificity"
             )
         elif additions and has_template:
             # Still track that we have constraints, but don't append to prompt
-            context["improvements"].append(
+            context.improvements.append(
                 f"Prepared {len(additions)} constraint(s) for template"
             )
         
-        context["current_prompt"] = prompt
-        context["metadata"]["expand_constraints"] = {
+        context.current_prompt = prompt
+        context.metadata["expand_constraints"] = {
             "constraints_added": len(additions),
             "constraint_list": additions,
             "appended_to_prompt": not has_template
@@ -214,7 +421,7 @@ class RefinementPipeline:
         
         return context
     
-    def _get_task_constraints(self, task_type: str) -> List[str]:
+    def _get_task_constraints(self, task_type: str) -> Tuple[str, ...]:
         """
         Get task-specific constraints.
         
@@ -222,39 +429,11 @@ class RefinementPipeline:
             task_type: Type of task
             
         Returns:
-            List of constraint strings
+            Tuple of constraint strings
         """
-        constraints_map = {
-            "code_generation": [
-                "Please include comments explaining the logic.",
-                "Follow best practices and coding standards.",
-                "Ensure the code is production-ready."
-            ],
-            "image_generation": [
-                "Specify the desired style, mood, and composition.",
-                "Include details about colors, lighting, and perspective."
-            ],
-            "research": [
-                "Provide sources and citations where applicable.",
-                "Include both overview and detailed analysis."
-            ],
-            "story_writing": [
-                "Develop characters with depth and motivation.",
-                "Include vivid descriptions and engaging dialogue."
-            ],
-            "sql_query": [
-                "Optimize for performance.",
-                "Include comments explaining complex joins or subqueries."
-            ],
-            "data_analysis": [
-                "Provide statistical insights and visualizations if applicable.",
-                "Explain methodology and assumptions."
-            ]
-        }
-        
-        return constraints_map.get(task_type, [])
+        return _TASK_CONSTRAINTS.get(task_type, ())
     
-    def _adjust_tone(self, context: Dict) -> Dict:
+    def _adjust_tone(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 3: Adjust the tone of the prompt.
         
@@ -264,28 +443,19 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        prompt = context["current_prompt"]
+        prompt = context.current_prompt
         original = prompt
         
         # Apply tone-specific transformations
-        if self.target_tone == ToneType.PROFESSIONAL:
-            prompt = self._make_professional(prompt)
-        elif self.target_tone == ToneType.CASUAL:
-            prompt = self._make_casual(prompt)
-        elif self.target_tone == ToneType.TECHNICAL:
-            prompt = self._make_technical(prompt)
-        elif self.target_tone == ToneType.CREATIVE:
-            prompt = self._make_creative(prompt)
-        elif self.target_tone == ToneType.FORMAL:
-            prompt = self._make_formal(prompt)
-        elif self.target_tone == ToneType.FRIENDLY:
-            prompt = self._make_friendly(prompt)
+        transform = self._TONE_TRANSFORMS.get(self.target_tone)
+        if transform is not None:
+            prompt = getattr(self, transform)(prompt)
         
         if prompt != original:
-            context["improvements"].append(f"Adjusted tone to {self.target_tone.value}")
+            context.improvements.append(f"Adjusted tone to {self.target_tone.value}")
         
-        context["current_prompt"] = prompt
-        context["metadata"]["adjust_tone"] = {
+        context.current_prompt = prompt
+        context.metadata["adjust_tone"] = {
             "target_tone": self.target_tone.value,
             "tone_changed": prompt != original
         }
@@ -295,7 +465,7 @@ class RefinementPipeline:
     def _make_professional(self, prompt: str) -> str:
         """Make prompt more professional."""
         # Remove casual language
-        prompt = re.sub(r'\b(kinda|sorta|gonna|wanna)\b', '', prompt, flags=re.IGNORECASE)
+        prompt = _replace_phrases(prompt, _CASUAL_WORDS)
         # Add professional framing if very short
         if len(prompt.split()) < 10:
             prompt = f"Please {prompt.lower()}"
@@ -304,13 +474,7 @@ class RefinementPipeline:
     def _make_casual(self, prompt: str) -> str:
         """Make prompt more casual."""
         # Replace formal words with casual equivalents
-        replacements = {
-            "please provide": "can you give me",
-            "kindly": "",
-            "request": "ask for"
-        }
-        for formal, casual in replacements.items():
-            prompt = re.sub(formal, casual, prompt, flags=re.IGNORECASE)
+        prompt = _replace_phrases(prompt, _CASUAL_REPLACEMENTS)
         return prompt.strip()
     
     def _make_technical(self, prompt: str) -> str:
@@ -330,15 +494,7 @@ class RefinementPipeline:
     def _make_formal(self, prompt: str) -> str:
         """Make prompt more formal."""
         # Remove contractions
-        contractions = {
-            "don't": "do not",
-            "can't": "cannot",
-            "won't": "will not",
-            "shouldn't": "should not",
-            "wouldn't": "would not"
-        }
-        for contraction, formal in contractions.items():
-            prompt = re.sub(contraction, formal, prompt, flags=re.IGNORECASE)
+        prompt = _replace_phrases(prompt, _CONTRACTIONS)
         return prompt
     
     def _make_friendly(self, prompt: str) -> str:
@@ -348,7 +504,7 @@ class RefinementPipeline:
             prompt = f"Hey! {prompt}"
         return prompt
     
-    def _optimize_tokens(self, context: Dict) -> Dict:
+    def _optimize_tokens(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 4: Optimize for token efficiency while preserving meaning.
         
@@ -358,30 +514,26 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        prompt = context["current_prompt"]
+        prompt = context.current_prompt
         original_length = len(prompt.split())
         
         # Remove redundant words
-        redundant_patterns = [
-            (r'\b(very|really|quite|rather)\s+', ''),  # Remove intensifiers
-            (r'\b(just|simply|basically|actually)\s+', ''),  # Remove filler words
-            (r'\bthat\s+', ''),  # Remove unnecessary "that"
-        ]
-        
-        for pattern, replacement in redundant_patterns:
-            prompt = re.sub(pattern, replacement, prompt, flags=re.IGNORECASE)
+        for pattern in _REDUNDANT_WORD_PATTERNS:
+            prompt = pattern.sub('', prompt)
         
         # Clean up any double spaces created
-        prompt = re.sub(r'\s+', ' ', prompt).strip()
+        prompt = _WHITESPACE_RE.sub(' ', prompt).strip()
         
-        new_length = len(prompt.split())
+        # Words are now separated by single spaces, so count the spaces
+        # rather than building a list of words
+        new_length = prompt.count(' ') + 1 if prompt else 0
         if new_length < original_length:
-            context["improvements"].append(
+            context.improvements.append(
                 f"Optimized token usage (reduced from {original_length} to {new_length} words)"
             )
         
-        context["current_prompt"] = prompt
-        context["metadata"]["optimize_tokens"] = {
+        context.current_prompt = prompt
+        context.metadata["optimize_tokens"] = {
             "original_word_count": original_length,
             "optimized_word_count": new_length,
             "reduction_percentage": round((1 - new_length / original_length) * 100, 2) if original_length > 0 else 0
@@ -389,7 +541,7 @@ class RefinementPipeline:
         
         return context
     
-    def _apply_template(self, context: Dict) -> Dict:
+    def _apply_template(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 5: Apply a format template to structure the prompt.
         
@@ -399,16 +551,16 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        template = context.get("format_template")
+        template = context.format_template
         if not template:
             return context
         
-        prompt = context["current_prompt"]
-        task_type = context.get("task_type", "general")
-        custom_constraints = context.get("custom_constraints", [])
+        prompt = context.current_prompt
+        task_type = context.task_type
+        custom_constraints = context.custom_constraints
         
         # Extract constraints from the expanded prompt
-        constraint_metadata = context.get("metadata", {}).get("expand_constraints", {})
+        constraint_metadata = context.metadata.get("expand_constraints", {})
         all_constraints = constraint_metadata.get("constraint_list", [])
         
         # Build replacement dictionary
@@ -502,16 +654,16 @@ class RefinementPipeline:
             formatted = formatted.replace(placeholder, value)
         
         # Remove any remaining unfilled placeholders
-        formatted = re.sub(r'\{\{[^}]+\}\}', '', formatted)
+        formatted = _PLACEHOLDER_RE.sub('', formatted)
         
         # Clean up any empty lines or excessive whitespace
-        formatted = re.sub(r'\n\s*\n\s*\n', '\n\n', formatted)
+        formatted = _BLANK_LINES_RE.sub('\n\n', formatted)
         formatted = formatted.strip()
         
-        context["current_prompt"] = formatted
-        context["improvements"].append("Applied format template for structure")
+        context.current_prompt = formatted
+        context.improvements.append("Applied format template for structure")
         
-        context["metadata"]["apply_template"] = {
+        context.metadata["apply_template"] = {
             "template_applied": True,
             "template_type": "structured",
             "placeholders_filled": len(replacements)
@@ -519,7 +671,7 @@ class RefinementPipeline:
         
         return context
     
-    def _validate(self, context: Dict) -> Dict:
+    def _validate(self, context: RefinementContext) -> RefinementContext:
         """
         Stage 6: Validate the refined prompt for quality and completeness.
         
@@ -529,7 +681,7 @@ class RefinementPipeline:
         Returns:
             Updated context
         """
-        prompt = context["current_prompt"]
+        prompt = context.current_prompt
         issues = []
         warnings = []
         
@@ -549,7 +701,7 @@ class RefinementPipeline:
         # Validation passed if no critical issues
         validation_passed = len(issues) == 0
         
-        context["metadata"]["validate"] = {
+        context.metadata["validate"] = {
             "validation_passed": validation_passed,
             "word_count": word_count,
             "issues": issues,
@@ -557,6 +709,6 @@ class RefinementPipeline:
         }
         
         if validation_passed:
-            context["improvements"].append("Validation passed - prompt is well-formed")
+            context.improvements.append("Validation passed - prompt is well-formed")
         
         return context
@@ -6,10 +6,12 @@ Install: pip install rich inquirer pyyaml
 Run : python better_prompt_cli.py
 """
 
+import functools
+import importlib
 import json
 import re
 import sys
-from typing import Dict, Tuple, Optional, Callable
+from typing import Dict, NamedTuple, Tuple, Optional, Callable
 from xml.etree import ElementTree as ET
 
 try:
@@ -24,13 +26,22 @@ except ImportError:
     sys.exit(1)
 
 try:
-    import yaml
-    HAS_YAML = True
+    import re2 as _regex
+    HAS_RE2 = True
 except ImportError:
-    HAS_YAML = False
+    _regex = re
+    HAS_RE2 = False
 
 console = Console()
 
+@functools.lru_cache(maxsize=None)
+def _optional_import(name: str):
+    """Import an optional dependency on first use; returns None if unavailable."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 # ============================================================================
 # MODEL-FORMAT MATRIX
 # ============================================================================
@@ -60,6 +71,10 @@ MODEL_MATRIX = {
     }
 }
 
+# Selection menus derived from the matrix once at import
+PROVIDER_CHOICES = list(MODEL_MATRIX)
+MODEL_CHOICES = {provider: list(models) for provider, models in MODEL_MATRIX.items()}
+
 BANNER = """[bold cyan]
 ╔═══════════════════════════════════════════════════════════╗
 ║                                                           ║
@@ -84,64 +99,125 @@ BANNER = """[bold cyan]
 # CORE FUNCTIONS
 # ============================================================================
 
-def analyze_prompt(text: str) -> Dict[str, str]:
-    """Parse prompt into semantic sections."""
-    sections = {"context": "", "instruction": "", "examples": "", "constraints": ""}
+# Section pattern for analyze_prompt: one alternation, compiled once at import,
+# so a single scan finds every section header. Bodies run greedily up to the
+# next blank line without lookarounds, which keeps the pattern inside the
+# RE2 subset; RE2 is used when installed, stdlib re otherwise
+_SECTION_HEADERS = (
+    ("context", "context|background|given"),
+    ("examples", "example|for instance"),
+    ("constraints", "format|output|must be|should be"),
+)
+_SECTION_BODY = r'(?:[^\n]|\n[^\n])+'
+
+# Flags are inlined in the pattern itself, so no call site passes flags=
+_SECTIONS_RE = _regex.compile(
+    r'(?i)' + "|".join(
+        rf'(?:{headers})[:\s]+(?P<{name}>{_SECTION_BODY})'
+        for name, headers in _SECTION_HEADERS
+    )
+)
+
+class Sections(NamedTuple):
+    """Semantic sections of a prompt, in output order."""
+    context: str = ""
+    instruction: str = ""
+    examples: str = ""
+    constraints: str = ""
+
+_EMPTY_SECTIONS = Sections()
+
+@functools.lru_cache(maxsize=4096)
+def analyze_prompt(text: str) -> Sections:
+    """Parse prompt into semantic sections (memoized; results are immutable)."""
     text = text.strip()
     if not text:
-        return sections
-    
-    # Extract context
-    ctx = re.search(r'(?:context|background|given)[:\s]+(.+?)(?=\n\n|\Z)', text, re.I | re.S)
-    if ctx:
-        sections["context"] = ctx.group(1).strip()
-        text = text.replace(ctx.group(0), "")
+        return _EMPTY_SECTIONS
     
-    # Extract examples
-    ex = re.search(r'(?:example|for instance)[:\s]+(.+?)(?=\n\n|\Z)', text, re.I | re.S)
-    if ex:
-        sections["examples"] = ex.group(1).strip()
-        text = text.replace(ex.group(0), "")
+    # First match of each section wins; its span (and any verbatim repeat
+    # of it) is cut from the instruction, which is assembled from the gaps
+    # between cut spans during the same scan
+    found: Dict[str, str] = {}
+    matched_text: Dict[str, str] = {}
+    pieces = []
+    pos = 0
+    for match in _SECTIONS_RE.finditer(text):
+        kind = match.lastgroup
+        if kind not in found:
+            found[kind] = match.group(kind).strip()
+            matched_text[kind] = match.group(0)
+        elif match.group(0) != matched_text[kind]:
+            continue
+        start, end = match.span()
+        pieces.append(text[pos:start])
+        pos = end
+    pieces.append(text[pos:])
+    instruction = "".join(pieces).strip()
     
-    # Extract constraints
-    con = re.search(r'(?:format|output|must be|should be)[:\s]+(.+?)(?=\n\n|\Z)', text, re.I | re.S)
-    if con:
-        sections["constraints"] = con.group(1).strip()
-        text = text.replace(con.group(0), "")
-    
-    sections["instruction"] = text.strip()
-    return sections
+    return Sections(
+        found.get("context", ""),
+        instruction,
+        found.get("examples", ""),
+        found.get("constraints", ""),
+    )
 
-def to_json(data: Dict) -> str:
+def to_json(data: Sections) -> str:
     """Format as JSON."""
-    return json.dumps({k: v for k, v in data.items() if v}, indent=2, ensure_ascii=False)
+    payload = {k: v for k, v in zip(Sections._fields, data) if v}
+    orjson = _optional_import("orjson")
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+# Characters XML 1.0 cannot represent even when escaped
+_XML_ILLEGAL_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
 
-def to_xml(data: Dict) -> str:
+def to_xml(data: Sections) -> str:
     """Format as XML."""
+    # Values are plain strings, so the only way to produce invalid XML is an
+    # illegal character; drop those up front instead of validating the output
+    strip = _XML_ILLEGAL_RE.sub
+    etree = _optional_import("lxml.etree")
+    if etree is not None:
+        root = etree.Element("prompt")
+        for k, v in zip(Sections._fields, data):
+            if v:
+                etree.SubElement(root, k).text = strip("", v)
+        return etree.tostring(root, pretty_print=True, encoding='unicode')
+    
     root = ET.Element("prompt")
-    for k, v in data.items():
+    for k, v in zip(Sections._fields, data):
         if v:
             child = ET.SubElement(root, k)
-            child.text = v
-    return ET.tostring(root, encoding='unicode', method='xml')
+            child.text = strip("", v)
+    ET.indent(root, space="  ")
+    return ET.tostring(root, encoding='unicode', method='xml') + "\n"
 
-def to_yaml(data: Dict) -> str:
+def to_yaml(data: Sections) -> str:
     """Format as YAML."""
-    if not HAS_YAML:
+    yaml = _optional_import("yaml")
+    if yaml is None:
         return "# YAML unavailable\n" + to_json(data)
-    return yaml.dump({k: v for k, v in data.items() if v}, allow_unicode=True, sort_keys=False)
+    return yaml.dump({k: v for k, v in zip(Sections._fields, data) if v}, allow_unicode=True, sort_keys=False)
 
-def to_markdown(data: Dict) -> str:
+def to_markdown(data: Sections) -> str:
     """Format as Markdown."""
-    lines = ["# Refined Prompt\n"]
-    mapping = {"instruction": "Task", "context": "Context", "examples": "Examples", "constraints": "Requirements"}
-    for k, title in mapping.items():
-        if data.get(k):
-            lines.append(f"## {title}\n{data[k]}\n")
-    return "\n".join(lines)
+    parts = ["# Refined Prompt\n"]
+    for header, value in (
+        ("## Task", data.instruction),
+        ("## Context", data.context),
+        ("## Examples", data.examples),
+        ("## Requirements", data.constraints),
+    ):
+        if value:
+            parts.append(f"{header}\n{value}\n")
+    return "\n".join(parts)
 
 FORMATTERS = {"json": to_json, "xml": to_xml, "yaml": to_yaml, "markdown": to_markdown}
 
+# Syntax highlighting lexer per output format
+_SYNTAX_LANG = {"json": "json", "xml": "xml", "yaml": "yaml", "markdown": "markdown"}
+
 # ============================================================================
 # PLUGIN SYSTEM
 # ============================================================================
@@ -211,12 +287,10 @@ def get_prompt_input() -> str:
 def select_provider_and_model() -> Tuple[str, str, str]:
     """Interactive provider and model selection."""
     try:
-        providers = list(MODEL_MATRIX.keys())
-        q1 = [inquirer.List('provider', message="Select AI Provider", choices=providers)]
+        q1 = [inquirer.List('provider', message="Select AI Provider", choices=PROVIDER_CHOICES)]
         provider = inquirer.prompt(q1)['provider']
         
-        models = list(MODEL_MATRIX[provider].keys())
-        q2 = [inquirer.List('model', message=f"Select {provider} Model", choices=models)]
+        q2 = [inquirer.List('model', message=f"Select {provider} Model", choices=MODEL_CHOICES[provider])]
         model = inquirer.prompt(q2)['model']
         
         format_type = MODEL_MATRIX[provider][model]
@@ -225,14 +299,25 @@ def select_provider_and_model() -> Tuple[str, str, str]:
         console.print(f"[red]Selection error: {e}. Using defaults.[/]")
         return "OpenAI", "GPT-4o", "json"
 
-def display_result(prompt: str, sections: Dict, format_type: str, provider: str, model: str):
+def save_to_file(filename: str, content: str) -> bool:
+    """Write content to filename, confirming before overwriting. Returns True if written."""
+    # Exclusive create fails atomically if the file exists, so there is no
+    # separate existence check to race against
+    try:
+        f = open(filename, 'x', encoding='utf-8')
+    except FileExistsError:
+        if not inquirer.confirm(f"{filename} exists. Overwrite?", default=False):
+            return False
+        f = open(filename, 'w', encoding='utf-8')
+    with f:
+        f.write(content)
+    return True
+
+def display_result(prompt: str, sections: Sections, format_type: str, provider: str, model: str):
     """Display refined prompt with syntax highlighting."""
     formatter = FORMATTERS.get(format_type, to_markdown)
     output = formatter(sections)
     
-    # Syntax mapping
-    syntax_lang = {"json": "json", "xml": "xml", "yaml": "yaml", "markdown": "markdown"}
-    
     console.print(Panel(
         f"[bold green]Provider:[/] {provider}\n"
         f"[bold green]Model:[/] {model}\n"
@@ -245,7 +330,7 @@ def display_result(prompt: str, sections: Dict, format_type: str, provider: str,
     console.print(Panel(prompt[:200] + "..." if len(prompt) > 200 else prompt, width=80, box=box.ROUNDED))
     
     console.print("\n[bold yellow]Refined Output:[/]")
-    syntax = Syntax(output, syntax_lang.get(format_type, "text"), theme="monokai", line_numbers=True)
+    syntax = Syntax(output, _SYNTAX_LANG.get(format_type, "text"), theme="monokai", line_numbers=True)
     console.print(Panel(syntax, box=box.ROUNDED, border_style="cyan"))
     
     # Save option
@@ -253,13 +338,12 @@ def display_result(prompt: str, sections: Dict, format_type: str, provider: str,
         save = inquirer.confirm("Save to file?", default=False)
         if save:
             filename = inquirer.text("Filename", default=f"prompt.{format_type}")
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(output)
-            console.print(f"[green]✓ Saved to {filename}[/]")
+            if save_to_file(filename, output):
+                console.print(f"[green]✓ Saved to {filename}[/]")
     except Exception as e:
         console.print(f"[red]Save error: {e}[/]")
 
-def show_plugin_options(manager: PluginManager, prompt: str, metadata: Dict) -> Dict:
+def show_plugin_options(manager: PluginManager, prompt: str, metadata: Dict) -> Sections:
     """Allow user to select and apply plugins."""
     available = manager.list_available()
     if not available:
@@ -274,7 +358,7 @@ def show_plugin_options(manager: PluginManager, prompt: str, metadata: Dict) ->
             console.print(f"[cyan]Applying {selection}...[/]")
             result = manager.apply_plugin(selection, prompt, metadata)
             if result:
-                return result
+                return Sections._make(result.get(k) or "" for k in Sections._fields)
     except Exception as e:
         console.print(f"[yellow]Plugin selection error: {e}[/]")
     
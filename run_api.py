@@ -6,9 +6,11 @@ Usage:
     
 Or with custom settings:
     python run_api.py --host 0.0.0.0 --port 8000 --reload
+
+The event loop and HTTP parser default to "auto", which picks uvloop and
+httptools when they are installed (both ship with uvicorn[standard]).
 """
 
-import uvicorn
 import argparse
 
 if __name__ == "__main__":
@@ -16,6 +18,10 @@ if __name__ == "__main__":
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    parser.add_argument("--loop", choices=["auto", "asyncio", "uvloop"], default="auto",
+                        help="Event loop implementation")
+    parser.add_argument("--http", choices=["auto", "h11", "httptools"], default="auto",
+                        help="HTTP protocol implementation")
     
     args = parser.parse_args()
     
@@ -31,13 +37,20 @@ if __name__ == "__main__":
 🔌 Port: {args.port}
 📚 Docs: http://{args.host}:{args.port}/docs
 🔄 Reload: {'Enabled' if args.reload else 'Disabled'}
+⚡ Loop: {args.loop} / HTTP: {args.http}
 
 """)
     
+    # Imported only once the arguments are valid, so --help and usage
+    # errors return without paying for the server stack
+    import uvicorn
+    
     uvicorn.run(
         "better_prompt.api.main:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        loop=args.loop,
+        http=args.http,
         log_level="info"
     )
@@ -2,7 +2,11 @@
 Basic tests for Better Prompt core functionality.
 """
 
+import asyncio
+import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path
@@ -11,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from better_prompt.core.classifier import TaskClassifier, TaskType
 from better_prompt.core.format_selector import FormatSelector, OutputFormat
 from better_prompt.core.refiner import RefinementPipeline, ToneType
-from better_prompt.core.pipeline import PipelineOrchestrator
+from better_prompt.core.pipeline import BatchStatistics, PipelineOrchestrator
 
 
 def test_task_classifier():
@@ -30,9 +34,38 @@ def test_task_classifier():
     assert result.task_type == TaskType.IMAGE_GENERATION
     assert result.confidence > 0.3  # More lenient threshold
     
+    # Repeated prompts are served from the cache as independent copies
+    repeat = classifier.classify("Create an image of a sunset")
+    assert repeat == result and repeat is not result
+    repeat.metadata["matches"].append("mutated")
+    assert "mutated" not in classifier.classify("Create an image of a sunset").metadata["matches"]
+    
     print("✓ TaskClassifier tests passed")
 
 
+def test_classify_batch():
+    """Test batch classification matches single-prompt classification."""
+    print("Testing TaskClassifier.classify_batch...")
+    
+    classifier = TaskClassifier()
+    prompts = [
+        "Write a Python function to sort an array",
+        "Create an image of a sunset",
+        "hello there",
+    ]
+    
+    results = classifier.classify_batch(prompts)
+    assert len(results) == len(prompts)
+    for prompt, result in zip(prompts, results):
+        single = classifier.classify(prompt)
+        assert result.task_type == single.task_type
+        assert result.confidence == single.confidence
+    
+    assert classifier.classify_batch([]) == []
+    
+    print("✓ classify_batch tests passed")
+
+
 def test_format_selector():
     """Test format selection."""
     print("Testing FormatSelector...")
@@ -52,6 +85,17 @@ def test_format_selector():
     models = selector.list_supported_models()
     assert len(models) > 0
     
+    # Test the model table covers every model and is built once
+    table = selector.model_table()
+    assert [f"{p}/{m}" for p, m, _ in table] == models
+    assert ("OpenAI", "gpt-4", "markdown") in table
+    assert selector.model_table() is table
+    
+    # Test template rendering keeps literal JSON braces
+    rendered = selector.render_template(OutputFormat.JSON, task_description="Sort a list")
+    assert '"task": "Sort a list"' in rendered
+    assert rendered.startswith("{") and "{{" not in rendered
+    
     print("✓ FormatSelector tests passed")
 
 
@@ -70,6 +114,14 @@ def test_refinement_pipeline():
     assert len(result.stages_applied) > 0
     assert len(result.improvements) >= 0
     
+    # Batch refinement matches refining one prompt at a time
+    prompts = ["write code to sort array", "  fix   this bug ,please"]
+    batch = pipeline.refine_batch(prompts, task_type="code_generation")
+    assert [r.refined_prompt for r in batch] == [
+        pipeline.refine(p, task_type="code_generation").refined_prompt for p in prompts
+    ]
+    assert pipeline.refine_batch([]) == []
+    
     print("✓ RefinementPipeline tests passed")
 
 
@@ -95,6 +147,13 @@ def test_pipeline_orchestrator():
     result_dict = result.to_dict()
     assert "original_prompt" in result_dict
     assert "refined_prompt" in result_dict
+    assert json.loads(result.to_json_bytes()) == result_dict
+    
+    # A different tone reuses a cached pipeline without retargeting the shared one
+    casual = orchestrator.process("write a poem", tone=ToneType.CASUAL)
+    assert casual.metadata["tone"] == "casual"
+    assert orchestrator.refinement_pipeline.target_tone == ToneType.PROFESSIONAL
+    assert orchestrator._pipeline_for(ToneType.CASUAL) is orchestrator._pipeline_for(ToneType.CASUAL)
     
     # Test get_summary
     summary = result.get_summary()
@@ -128,6 +187,23 @@ def test_batch_processing():
     assert stats["total_prompts"] == len(prompts)
     assert "task_type_distribution" in stats
     
+    # Incremental statistics match the batch ones
+    statistics = BatchStatistics()
+    assert statistics.summary() == {}
+    for result in results:
+        statistics.add(result)
+    assert statistics.summary() == stats
+    
+    # Test async batch processing keeps input order
+    async_results = asyncio.run(orchestrator.aprocess_batch(
+        prompts=prompts,
+        model_name="gpt-4",
+        provider="OpenAI",
+        max_concurrency=2
+    ))
+    assert [r.original_prompt for r in async_results] == prompts
+    assert [r.refined_prompt for r in async_results] == [r.refined_prompt for r in results]
+    
     print("✓ Batch processing tests passed")
 
 
@@ -154,11 +230,57 @@ def test_llm_gateway():
     assert response.content is not None
     assert response.model == "dummy-gpt-4"
     
+    # Test request-body serialization matches to_dict()
+    from better_prompt.core.llm_gateway import messages_to_json
+    assert json.loads(messages_to_json(messages)) == [m.to_dict() for m in messages]
+    
     # Test embeddings
     texts = ["hello", "world"]
     emb_response = provider.embeddings(model="dummy-embedding-v1", texts=texts)
     assert len(emb_response.embeddings) == len(texts)
     
+    # Test batched embeddings keep order and sum usage across batches
+    many = ["a", "bb", "ccc", "dddd", "eeeee"]
+    batched = provider.batch_embeddings(model="dummy-embedding-v1", texts=many, batch_size=2)
+    single = provider.embeddings(model="dummy-embedding-v1", texts=many)
+    assert batched.embeddings == single.embeddings
+    assert batched.usage == single.usage
+    
+    # Test deterministic completions are served from the response cache
+    first = provider.completion(model="dummy-gpt-4", messages=messages, temperature=0)
+    calls = provider.get_call_count()
+    again = provider.completion(model="dummy-gpt-4", messages=messages, temperature=0)
+    assert again.content == first.content
+    assert provider.get_call_count() == calls
+    
+    # An override delegating to super() is cached once, and no_cache bypasses it
+    class DelegatingProvider(DummyProvider):
+        def completion(self, model, messages, temperature=0.7, max_tokens=None, **kwargs):
+            return super().completion(model, messages, temperature, max_tokens, **kwargs)
+    
+    delegating = DelegatingProvider()
+    for _ in range(3):
+        delegating.completion(model="dummy-gpt-4", messages=messages, temperature=0, no_cache=True)
+    assert delegating.get_call_count() == 3 and len(delegating.response_cache) == 0
+    delegating.completion(model="dummy-gpt-4", messages=messages, temperature=0)
+    delegating.completion(model="dummy-gpt-4", messages=messages, temperature=0)
+    assert delegating.get_call_count() == 4 and len(delegating.response_cache) == 1
+
+    # Test the semantic cache answers a request whose last message embeds alike
+    from better_prompt.core.llm_gateway import SemanticCache
+    inner = DummyProvider()
+    semantic = SemanticCache(inner, embedding_model="dummy-embedding-v1", threshold=0.99)
+    cached = semantic.completion("dummy-gpt-4", [Message(MessageRole.USER, "explain X")], temperature=0)
+    similar = semantic.completion("dummy-gpt-4", [Message(MessageRole.USER, "outline X")], temperature=0)
+    assert similar.content == cached.content
+    assert semantic.hits == 1 and len(semantic) == 1
+    semantic.completion("dummy-gpt-4", [Message(MessageRole.SYSTEM, "explain X")], temperature=0)
+    assert semantic.misses == 2
+    
+    # Test async completion
+    response = asyncio.run(provider.acompletion(model="dummy-gpt-4", messages=messages))
+    assert response.model == "dummy-gpt-4"
+    
     print("✓ LLM Gateway tests passed")
 
 
@@ -188,6 +310,8 @@ def test_plugin_system():
     
     plugins = registry.list_plugins()
     assert len(plugins) == 1
+    assert registry.list_plugins(plugin_type=PluginType.REFINER) == plugins
+    assert registry.list_plugins(plugin_type=PluginType.CLASSIFIER) == []
     
     # Test enable/disable
     assert registry.disable_plugin("test-plugin")
@@ -196,6 +320,65 @@ def test_plugin_system():
     assert registry.enable_plugin("test-plugin")
     assert registry.get_plugin("test-plugin").enabled
     
+    # Test discovery finds saved manifests and skips hidden/vendored directories
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        manifest.save(root / "refiners" / "test" / "manifest.json")
+        manifest.save(root / "node_modules" / "pkg" / "manifest.json")
+        manifest.save(root / ".cache" / "manifest.json")
+        discovering = PluginRegistry([root])
+        assert discovering.discover_plugins() == 1
+        assert PluginRegistry([root]).discover_plugins(max_workers=4) == 1
+        assert discovering.get_plugin("test-plugin") is not None
+        
+        # A malformed manifest next to a valid one is skipped, not registered
+        bad = root / "refiners" / "bad" / "manifest.json"
+        bad.parent.mkdir(parents=True)
+        for dependencies in (5, "dep"):
+            bad.write_text(json.dumps({
+                "name": "bad", "version": "1.0", "entry_point": "x", "dependencies": dependencies
+            }))
+            mixed = PluginRegistry([root])
+            assert mixed.discover_plugins() == 1
+            assert [p.name for p in mixed.list_plugins()] == ["test-plugin"]
+            assert mixed.get_statistics()["total_plugins"] == 1
+        bad.unlink()
+
+        # A rewrite with an unchanged mtime is still picked up (size differs)
+        path = root / "refiners" / "test" / "manifest.json"
+        stat = path.stat()
+        manifest.description = "Test plugin, edited"
+        manifest.save(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert PluginManifest.from_file(path).description == "Test plugin, edited"
+        
+        # A module entry point is loaded lazily: its code runs on first use
+        (root / "lazy_test_plugin.py").write_text("import os\nos.environ['LAZY_TEST_PLUGIN'] = '1'\nVALUE = 42\n")
+        sys.path.insert(0, tmp)
+        try:
+            registry.register_plugin(PluginManifest(
+                name="lazy-plugin", version="1.0.0", plugin_type=PluginType.CUSTOM,
+                description="Lazy plugin", author="Test", entry_point="lazy_test_plugin"
+            ))
+            module = registry.load_plugin("lazy-plugin")
+            assert "LAZY_TEST_PLUGIN" not in os.environ
+            assert module.VALUE == 42 and os.environ.pop("LAZY_TEST_PLUGIN") == "1"
+            
+            # A lazily loaded submodule is bound on its package, like a normal import
+            (root / "lazy_test_pkg").mkdir()
+            (root / "lazy_test_pkg" / "__init__.py").write_text("")
+            (root / "lazy_test_pkg" / "sub.py").write_text("VALUE = 7\n")
+            registry.register_plugin(PluginManifest(
+                name="lazy-sub", version="1.0.0", plugin_type=PluginType.CUSTOM,
+                description="Lazy submodule", author="Test", entry_point="lazy_test_pkg.sub"
+            ))
+            submodule = registry.load_plugin("lazy-sub")
+            assert sys.modules["lazy_test_pkg"].sub is submodule and submodule.VALUE == 7
+        finally:
+            sys.path.remove(tmp)
+            for name in ("lazy_test_plugin", "lazy_test_pkg", "lazy_test_pkg.sub"):
+                sys.modules.pop(name, None)
+
     print("✓ Plugin System tests passed")
 
 
@@ -207,6 +390,7 @@ def run_all_tests():
     
     tests = [
         test_task_classifier,
+        test_classify_batch,
         test_format_selector,
         test_refinement_pipeline,
         test_pipeline_orchestrator,